@@ -0,0 +1,109 @@
+# backend_benchmark.py
+# 가짜 에디터(fake_naver_editor.py)에 Chrome을 띄워 입력 경로(selenium / cdp)별 명령 지연을 비교
+#
+# 예)  python backend_benchmark.py --iterations 50 --chunk-chars 500
+# 출력: 백엔드 × 명령(insert_text, select_all, read_text, evaluate)별 p50/p90/p99/max (ms)
+
+import argparse
+import time
+
+from browser_backends import BACKENDS, make_input
+from fake_naver_editor import serve_fake_editor
+
+
+SAMPLE = "오늘은 서울 근교의 작은 카페를 다녀왔습니다. 창가 자리에 앉으니 햇살이 따뜻하게 들어왔어요.\n"
+
+
+def start_browser(headless: bool):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    opts = Options()
+    if headless:
+        opts.add_argument("--headless=new")
+    opts.add_argument("--window-size=1600,950")
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+
+
+def open_editor(driver, port: int):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver.get(f"http://127.0.0.1:{port}/GoBlogWrite.naver")
+    wait = WebDriverWait(driver, 10)
+    wait.until(EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe#mainFrame")))
+    body = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".se-section-text")))
+    driver.execute_script("document.querySelectorAll('.se-popup, .se-popup-dim').forEach(e => e.remove());")
+    body.click()
+
+
+def timed(samples: dict, name: str, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def run_backend(backend: str, args) -> dict:
+    driver = start_browser(not args.headed)
+    try:
+        open_editor(driver, args.port)
+        inputs = make_input(driver, backend)
+        text = (SAMPLE * (args.chunk_chars // len(SAMPLE) + 1))[:args.chunk_chars]
+        samples: dict[str, list[float]] = {}
+        body = ""
+        for _ in range(args.iterations):
+            timed(samples, "select_all", inputs.select_all)
+            timed(samples, "insert_text", inputs.insert_text, text)
+            body = timed(samples, "read_text", inputs.read_text, ".se-section-text", 10)
+            timed(samples, "evaluate", inputs.evaluate, "doc => doc.querySelectorAll('p, div, br').length")
+        # 매번 전체 선택 후 덮어쓰므로 마지막 본문은 입력한 텍스트 한 벌이어야 함
+        if body.split() != text.split():
+            print(f"⚠️ {backend}: 본문이 입력한 텍스트와 다름 ({len(body)}자 / {len(text)}자)")
+        inputs.close()
+        if inputs.fallbacks:
+            print(f"⚠️ {backend}: {inputs.fallbacks}번 selenium으로 대신 처리됨")
+        return samples
+    finally:
+        driver.quit()
+
+
+def report(results: dict):
+    def pct(values, q):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    print(f"\n{'backend':<10}{'op':<13}{'count':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for backend, samples in results.items():
+        for op, values in samples.items():
+            print(
+                f"{backend:<10}{op:<13}{len(values):>7}"
+                f"{pct(values, .5):>9.1f}{pct(values, .9):>9.1f}{pct(values, .99):>9.1f}{max(values):>9.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="입력 경로(selenium / cdp)별 명령 지연 비교")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--chunk-chars", type=int, default=500, help="insert_text 한 번에 보낼 글자 수")
+    parser.add_argument("--port", type=int, default=8765, help="가짜 에디터 포트")
+    parser.add_argument("--headed", action="store_true", help="창을 띄워서 실행")
+    args = parser.parse_args()
+
+    server, _ = serve_fake_editor(args.port, background=True)
+    results = {}
+    try:
+        for backend in args.backends.split(","):
+            print(f"⏱️ {backend} 측정 중...")
+            results[backend] = run_backend(backend.strip(), args)
+    finally:
+        server.shutdown()
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# blog_load_test.py
+# n8n 워크플로처럼 create / edit(append·replace·remove·edit_title) / current-body 요청을 섞어 보내고
+# 처리량, 지연 백분위, 에러율, 대기(queueing) 시간을 요청 종류별로 출력
+#
+# 예)  python blog_load_test.py --server http://127.0.0.1:8000 --workflows 4 --duration 120 \
+#          --mix create=1,append=3,replace=2,remove=1,edit_title=1,current_body=2 --fake-editor-port 8765
+# 서버는 가짜 에디터를 보도록 띄워둬야 함 (fake_naver_editor.py 상단 참고)
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+
+
+SENTENCES = [
+    "오늘은 서울 근교의 작은 카페를 다녀왔습니다.",
+    "창가 자리에 앉으니 햇살이 따뜻하게 들어왔어요.",
+    "시그니처 메뉴인 바닐라 라떼는 달지 않고 고소했습니다.",
+    "주차 공간은 넉넉한 편이라 차로 오기에도 편합니다.",
+    "주말 오후에는 사람이 많으니 오전 방문을 추천드려요.",
+    "디저트로 주문한 치즈케이크도 꾸덕하고 맛있었어요.",
+    "매장 안쪽에는 조용히 작업하기 좋은 좌석도 있습니다.",
+    "가격은 조금 있는 편이지만 분위기를 생각하면 괜찮아요.",
+]
+
+
+def make_body(size: int, rnd: random.Random) -> tuple[str, list[str]]:
+    """size 글자 정도의 본문과, 그 안에 들어간 (replace/remove 대상으로 쓸) 고유 문장들"""
+    lines, markers, length = [], [], 0
+    while length < size:
+        marker = f"[{uuid.uuid4().hex[:8]}] {rnd.choice(SENTENCES)}"
+        lines.append(marker)
+        markers.append(marker)
+        length += len(marker) + 1
+    return "\n".join(lines), markers
+
+
+def parse_range(text: str) -> tuple[float, float]:
+    low, _, high = text.partition("-")
+    return float(low), float(high or low)
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    timings = {}
+    for part in (header or "").split(","):
+        name, _, dur = part.strip().partition(";dur=")
+        if dur:
+            timings[name] = float(dur) / 1000
+    return timings
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = defaultdict(list)
+        self.queueing = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.status = defaultdict(lambda: defaultdict(int))
+
+    def add(self, kind: str, seconds: float, status: int, timings: dict):
+        with self.lock:
+            self.latency[kind].append(seconds)
+            self.status[kind][status] += 1
+            if status >= 400 or status == 0:
+                self.errors[kind] += 1
+            if timings:
+                self.queueing[kind].append(sum(timings.get(name, 0) for name in ("limiter", "session_lock", "lease")))
+
+    def report(self, elapsed: float):
+        def pct(values, q):
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+        total = sum(len(v) for v in self.latency.values())
+        print(f"\n총 {total}건 / {elapsed:.1f}초 → {total / elapsed:.2f} req/s")
+        print(f"{'type':<14}{'count':>7}{'rps':>8}{'err%':>7}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}{'queue p50':>11}{'queue p99':>11}")
+        for kind in sorted(self.latency):
+            lat = self.latency[kind]
+            q = self.queueing[kind]
+            print(
+                f"{kind:<14}{len(lat):>7}{len(lat) / elapsed:>8.2f}{100 * self.errors[kind] / len(lat):>7.1f}"
+                f"{pct(lat, .5):>8.2f}{pct(lat, .9):>8.2f}{pct(lat, .99):>8.2f}{max(lat):>8.2f}"
+                f"{pct(q, .5):>11.2f}{pct(q, .99):>11.2f}"
+            )
+        for kind in sorted(self.status):
+            print(f"  {kind}: " + ", ".join(f"{code}×{n}" for code, n in sorted(self.status[kind].items())))
+
+
+def call(server: str, method: str, path: str, payload: dict = None, timeout: float = 300):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(server + path, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read() or b"{}"), resp.headers.get("Server-Timing")
+    except urllib.error.HTTPError as e:
+        return e.code, {}, e.headers.get("Server-Timing")
+    except (urllib.error.URLError, TimeoutError, ConnectionError):
+        return 0, {}, None
+
+
+def workflow(worker_id: int, args, mix: dict, recorder: Recorder, stop_at: float, budget: list):
+    """가상 n8n 워크플로 하나: 글을 만들고, 그 글에 대해 섞인 요청을 보냄"""
+    rnd = random.Random(args.seed + worker_id)
+    session_id = f"load-{worker_id}-{uuid.uuid4().hex[:6]}"
+    markers: list[str] = []
+    kinds, weights = list(mix), list(mix.values())
+    first = True
+
+    while time.monotonic() < stop_at:
+        with recorder.lock:
+            if budget[0] is not None:
+                if budget[0] <= 0:
+                    return
+                budget[0] -= 1
+
+        kind = "create" if first or not markers and "create" in mix else rnd.choices(kinds, weights)[0]
+        first = False
+        payload, method, path = None, "POST", "/post-to-naver"
+        if kind == "create":
+            body, markers = make_body(int(rnd.uniform(*args.body_size)), rnd)
+            payload = {"action": "create", "title": f"부하 테스트 {session_id}", "body": body, "session_id": session_id}
+            if args.create_priority:
+                payload["priority"] = args.create_priority
+        elif kind == "append":
+            extra, new_markers = make_body(int(rnd.uniform(*args.append_size)), rnd)
+            markers += new_markers
+            payload = {"action": "edit", "directive": "append", "replacement": extra, "session_id": session_id}
+        elif kind in ("replace", "remove") and markers:
+            target = markers.pop(rnd.randrange(len(markers)))
+            payload = {"action": "edit", "directive": kind, "target": target, "session_id": session_id}
+            if kind == "replace":
+                new_marker = f"[{uuid.uuid4().hex[:8]}] {rnd.choice(SENTENCES)}"
+                payload["replacement"] = new_marker
+                markers.append(new_marker)
+        elif kind == "edit_title":
+            payload = {"action": "edit", "directive": "edit_title", "replacement": f"수정 {uuid.uuid4().hex[:6]}", "session_id": session_id}
+        elif kind == "current_body":
+            method, path = "GET", "/current-body"
+        else:
+            continue
+
+        start = time.monotonic()
+        status, _, timing_header = call(args.server, method, path, payload)
+        recorder.add(kind, time.monotonic() - start, status, parse_server_timing(timing_header))
+        time.sleep(rnd.uniform(*args.think_time))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="n8n 트래픽 흉내 부하 테스트")
+    parser.add_argument("--server", default="http://127.0.0.1:8000")
+    parser.add_argument("--workflows", type=int, default=4, help="동시에 도는 워크플로 수")
+    parser.add_argument("--duration", type=float, default=60, help="최대 실행 시간(초)")
+    parser.add_argument("--requests", type=int, default=None, help="총 요청 수 제한")
+    parser.add_argument("--mix", default="create=1,append=3,replace=2,remove=1,edit_title=1,current_body=2")
+    parser.add_argument("--body-size", type=parse_range, default=(1500, 4000), help="create 본문 글자 수 범위")
+    parser.add_argument("--append-size", type=parse_range, default=(100, 400), help="append 글자 수 범위")
+    parser.add_argument("--think-time", type=parse_range, default=(0.5, 2.0), help="요청 사이 대기(초) 범위")
+    parser.add_argument("--create-priority", default=None, help="create 요청 우선순위 (예: bulk)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fake-editor-port", type=int, default=None, help="지정하면 가짜 에디터도 같이 띄움")
+    parser.add_argument("--fake-editor-latency-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    fake_state = None
+    if args.fake_editor_port:
+        from fake_naver_editor import serve_fake_editor
+
+        _, fake_state = serve_fake_editor(args.fake_editor_port, args.fake_editor_latency_ms, background=True)
+        print(f"🧪 가짜 에디터 http://127.0.0.1:{args.fake_editor_port}/GoBlogWrite.naver")
+
+    recorder = Recorder()
+    budget = [args.requests]
+    started = time.monotonic()
+    stop_at = started + args.duration
+    threads = [
+        threading.Thread(target=workflow, args=(i, args, parse_mix(args.mix), recorder, stop_at, budget), daemon=True)
+        for i in range(args.workflows)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    recorder.report(time.monotonic() - started)
+    if fake_state is not None:
+        print(f"가짜 에디터: {fake_state.counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# browser_backends.py
+# 에디터에 자주 보내는 명령(텍스트 입력, 전체 선택, 본문 읽기, 스크립트 실행)을 보내는 경로
+# - selenium: 기존 방식, 명령마다 chromedriver HTTP 왕복
+# - cdp: 브라우저의 DevTools 웹소켓을 직접 열어두고 명령을 이어서 보냄 (chromedriver 안 거침)
+# 서버는 BROWSER_BACKEND 환경변수로 고름, 비교는 backend_benchmark.py
+
+import json
+import time
+import urllib.request
+
+
+class CdpError(RuntimeError):
+    pass
+
+
+# 편집기 iframe 안의 document (CDP는 최상위 프레임에서 실행되므로 직접 찾아 들어감)
+EDITOR_DOCUMENT_JS = "((document.querySelector('iframe#mainFrame') || {}).contentDocument || document)"
+
+# selector 요소가 생길 때까지 DOM 변경을 기다렸다가 innerText 반환
+READ_TEXT_JS = """(doc, selector, timeoutMs) => new Promise((resolve, reject) => {
+  const read = () => {
+    const el = doc.querySelector(selector);
+    if (!el) return false;
+    resolve(el.innerText || "");
+    return true;
+  };
+  if (read()) return;
+  const observer = new MutationObserver(() => {
+    if (read()) { observer.disconnect(); clearTimeout(timer); }
+  });
+  observer.observe(doc, {childList: true, subtree: true});
+  const timer = setTimeout(() => { observer.disconnect(); reject(new Error("timeout: " + selector)); }, timeoutMs);
+})"""
+
+
+class SeleniumInput:
+    """기존 경로: 명령마다 chromedriver HTTP 왕복 (편집기 iframe으로 전환된 상태에서 사용)"""
+
+    name = "selenium"
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.fallbacks = 0
+
+    def insert_text(self, text: str):
+        from selenium.webdriver.common.action_chains import ActionChains
+
+        ActionChains(self.driver).send_keys(text).perform()
+
+    def select_all(self):
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.webdriver.common.keys import Keys
+
+        ActionChains(self.driver).key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
+
+    def read_text(self, selector: str, timeout: float) -> str:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        el = WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        return el.get_attribute("innerText") or ""
+
+    def evaluate(self, fn: str, *args):
+        """fn(doc, ...args) 를 편집기 document에서 실행하고 값 반환"""
+        return self.driver.execute_script(f"return ({fn})(document, ...arguments);", *args)
+
+    def close(self):
+        pass
+
+
+class CdpInput:
+    """
+    브라우저 DevTools 웹소켓(websocket-client, selenium 설치 시 같이 설치됨)으로 명령을 직접 보냄
+    - 연결은 드라이버당 하나를 열어두고 재사용, 여러 명령은 응답을 기다리지 않고 이어서 보낸 뒤 한 번에 받음
+    - 연결 자체가 안 되면(주소 없음, 포트 막힘 등) 한동안 SeleniumInput으로 대신 처리
+    - 명령을 보낸 뒤 끊기면 중복 입력을 막기 위해 대신 처리하지 않고 CdpError
+    """
+
+    name = "cdp"
+    RECONNECT_AFTER_SEC = 30
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.fallback = SeleniumInput(driver)
+        self.fallbacks = 0
+        self.ws = None
+        self.next_id = 0
+        self.broken_until = 0.0
+
+    def _socket(self):
+        if self.ws is not None:
+            return self.ws
+        import websocket
+
+        address = (self.driver.capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+        if not address:
+            raise CdpError("debuggerAddress 없음")
+        with urllib.request.urlopen(f"http://{address}/json", timeout=5) as resp:
+            targets = [t for t in json.load(resp) if t.get("type") == "page"]
+        handle = self.driver.current_window_handle  # chromedriver 창 핸들 = DevTools target id
+        target = next((t for t in targets if t["id"] == handle), targets[0] if targets else None)
+        if target is None:
+            raise CdpError("연결할 페이지 없음")
+        self.ws = websocket.create_connection(target["webSocketDebuggerUrl"], timeout=10, suppress_origin=True)
+        return self.ws
+
+    def _available(self) -> bool:
+        if self.ws is not None:
+            return True
+        if time.monotonic() < self.broken_until:
+            return False
+        try:
+            self._socket()
+            return True
+        except Exception as e:
+            self.broken_until = time.monotonic() + self.RECONNECT_AFTER_SEC
+            print(f"⚠️ DevTools 연결 실패, selenium으로 대신 처리: {e}")
+            return False
+
+    def batch(self, commands: list, timeout: float = 30) -> list[dict]:
+        """[(method, params), ...] 를 이어서 보내고 결과를 보낸 순서대로 반환"""
+        ws = self._socket()
+        ids = []
+        try:
+            ws.settimeout(timeout)
+            for method, params in commands:
+                self.next_id += 1
+                ids.append(self.next_id)
+                ws.send(json.dumps({"id": self.next_id, "method": method, "params": params}))
+            replies = {}
+            while len(replies) < len(ids):
+                msg = json.loads(ws.recv())
+                if msg.get("id") in ids:
+                    replies[msg["id"]] = msg
+                # 이벤트는 구독하지 않으므로 버림
+        except Exception as e:
+            self.close()
+            raise CdpError(f"DevTools 연결 끊김: {e}")
+        results = []
+        for (method, _), msg_id in zip(commands, ids):
+            reply = replies[msg_id]
+            if "error" in reply:
+                raise CdpError(f"{method}: {reply['error'].get('message')}")
+            results.append(reply.get("result", {}))
+        return results
+
+    def _use_fallback(self) -> bool:
+        if self._available():
+            return False
+        self.fallbacks += 1
+        return True
+
+    def insert_text(self, text: str):
+        if self._use_fallback():
+            return self.fallback.insert_text(text)
+        # 줄바꿈은 Enter 키로 (insertText의 \n은 에디터가 문단으로 나누지 않음)
+        commands = []
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                for kind in ("keyDown", "keyUp"):
+                    commands.append(("Input.dispatchKeyEvent", {
+                        "type": kind, "key": "Enter", "code": "Enter", "windowsVirtualKeyCode": 13,
+                        **({"text": "\r"} if kind == "keyDown" else {}),
+                    }))
+            if line:
+                commands.append(("Input.insertText", {"text": line}))
+        if commands:
+            self.batch(commands)
+
+    def select_all(self):
+        if self._use_fallback():
+            return self.fallback.select_all()
+        key = {"key": "a", "code": "KeyA", "windowsVirtualKeyCode": 65, "modifiers": 2}
+        self.batch([
+            ("Input.dispatchKeyEvent", {"type": "keyDown", **key, "commands": ["selectAll"]}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", **key}),
+        ])
+
+    def evaluate(self, fn: str, *args, timeout: float = 30):
+        """fn(doc, ...args) 를 편집기 document에서 실행 (Promise면 끝날 때까지 기다림)"""
+        if self._use_fallback():
+            return self.fallback.evaluate(fn, *args)
+        expression = f"({fn})({EDITOR_DOCUMENT_JS}, ...{json.dumps(list(args), ensure_ascii=False)})"
+        (result,) = self.batch([("Runtime.evaluate", {
+            "expression": expression, "returnByValue": True, "awaitPromise": True,
+        })], timeout=timeout + 5)
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            message = (details.get("exception") or {}).get("description") or details.get("text")
+            raise CdpError(f"스크립트 오류: {message}")
+        return result.get("result", {}).get("value")
+
+    def read_text(self, selector: str, timeout: float) -> str:
+        if self._use_fallback():
+            return self.fallback.read_text(selector, timeout)
+        return self.evaluate(READ_TEXT_JS, selector, int(timeout * 1000), timeout=timeout) or ""
+
+    def close(self):
+        if self.ws is not None:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+            self.ws = None
+
+
+BACKENDS = {"selenium": SeleniumInput, "cdp": CdpInput}
+
+
+def make_input(driver, backend: str):
+    if backend not in BACKENDS:
+        raise ValueError(f"BROWSER_BACKEND는 {', '.join(BACKENDS)} 중 하나")
+    return BACKENDS[backend](driver)
@@ -0,0 +1,613 @@
+# editor_engines.py
+# 에디터 조작을 브라우저 종류와 상관없이 같은 비동기 인터페이스(EditorEngine)로 표현
+# - SeleniumEngine: 기존 chromedriver 드라이버. 막히는 호출은 스레드에서 실행 (입력 경로는 browser_backends)
+# - CdpEngine: Chrome DevTools 웹소켓 하나로 여러 탭을 이벤트 루프에서 직접 조작 (드라이버/스레드 없음)
+#   websockets 패키지가 필요 (pip install websockets)
+# 서버는 EDITOR_ENGINE 환경변수로 고르고, 엔진 코루틴은 전용 이벤트 루프 스레드에서 돌림
+
+import asyncio
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from browser_backends import CdpError, SeleniumInput
+
+
+ENGINES = ("selenium", "cdp-async")
+
+
+class EngineError(RuntimeError):
+    pass
+
+
+class EngineTimeout(EngineError):
+    pass
+
+
+class EditorEngine(ABC):
+    """
+    에디터 조작 단위 (모두 코루틴)
+    selector는 지금 들어가 있는 프레임(enter_frame) 기준, timeout은 초
+    """
+
+    name = "base"
+    inputs = None  # 텍스트 입력 경로 (SeleniumEngine만, browser_backends)
+
+    @property
+    def pid(self) -> Optional[int]:
+        """메모리 감시용 프로세스 트리의 루트 pid"""
+        return None
+
+    @abstractmethod
+    async def goto(self, url: str):
+        """최상위 프레임에서 url로 이동 (프레임 선택은 초기화)"""
+
+    @abstractmethod
+    async def enter_frame(self, selector: str, timeout: float):
+        """최상위 문서의 iframe(selector) 안으로 들어감"""
+
+    @abstractmethod
+    async def wait_for(self, selector: str, timeout: float, clickable: bool = False):
+        ...
+
+    @abstractmethod
+    async def click(self, selector: str, timeout: float):
+        """클릭할 수 있을 때까지 기다렸다가 화면 가운데로 스크롤 후 클릭 (가려져 있으면 스크립트 클릭)"""
+
+    @abstractmethod
+    async def click_if_present(self, selector: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def insert_text(self, text: str):
+        """커서 위치에 입력 (줄바꿈은 Enter)"""
+
+    @abstractmethod
+    async def select_all(self):
+        ...
+
+    @abstractmethod
+    async def set_input_value(self, selector: str, text: str, timeout: float):
+        """
+        입력칸(selector)에 키를 하나씩 누르지 않고 값을 넣음 (로그인 정보 등)
+        클릭으로 포커스 후 CDP Input.insertText, 값이 다르면 네이티브 value setter + input/change 이벤트
+        """
+
+    @abstractmethod
+    async def read_text(self, selector: str, timeout: float) -> str:
+        """요소가 생길 때까지 기다렸다가 innerText 반환"""
+
+    @abstractmethod
+    async def evaluate(self, fn: str, *args):
+        """fn(doc, ...args) 를 지금 프레임의 document에서 실행 (JSON으로 주고받을 수 있는 값만)"""
+
+    @abstractmethod
+    async def wait_until(self, fn: str, timeout: float, *args):
+        """fn(doc, ...args) 가 참이 될 때까지 기다렸다가 그 값을 반환"""
+
+    @abstractmethod
+    async def set_files(self, selector: str, paths: list[str], timeout: float):
+        """file input(selector)에 파일들을 한 번에 넣음"""
+
+    @abstractmethod
+    async def url(self) -> str:
+        ...
+
+    @abstractmethod
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float) -> str:
+        ...
+
+    async def memory_mb(self) -> Optional[float]:
+        """
+        이 엔진(탭) 하나가 쓰는 메모리(MB). 프로세스를 따로 갖지 않아 pid로 잴 수 없는 엔진만 구현
+        (None이면 메모리 감시는 pid의 프로세스 트리 RSS를 봄)
+        """
+        return None
+
+    async def close(self):
+        """이 엔진이 쓰던 브라우저(또는 탭)를 닫음"""
+        pass
+
+
+# ─────────────────────────────
+# Selenium (기존 드라이버)
+# ─────────────────────────────
+class SeleniumEngine(EditorEngine):
+    """chromedriver 호출은 막히므로 asyncio.to_thread로 실행. 입력/읽기는 inputs(SeleniumInput 또는 CdpInput)로"""
+
+    name = "selenium"
+
+    def __init__(self, driver, inputs=None):
+        self.driver = driver
+        self.inputs = inputs or SeleniumInput(driver)
+
+    @property
+    def pid(self) -> Optional[int]:
+        try:
+            return self.driver.service.process.pid  # chromedriver (Chrome은 그 자식 프로세스)
+        except AttributeError:
+            return None
+
+    def _wait(self, timeout: float, condition):
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        try:
+            return WebDriverWait(self.driver, timeout).until(condition)
+        except TimeoutException as e:
+            raise EngineTimeout(e.msg or "대기 시간 초과")
+
+    def _element(self, selector: str, timeout: float, clickable: bool):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+
+        locator = (By.CSS_SELECTOR, selector)
+        condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+        return self._wait(timeout, condition)
+
+    async def goto(self, url: str):
+        await asyncio.to_thread(self.driver.get, url)
+
+    async def enter_frame(self, selector: str, timeout: float):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+
+        def run():
+            self.driver.switch_to.default_content()
+            self._wait(timeout, EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, selector)))
+
+        await asyncio.to_thread(run)
+
+    async def wait_for(self, selector: str, timeout: float, clickable: bool = False):
+        await asyncio.to_thread(self._element, selector, timeout, clickable)
+
+    async def click(self, selector: str, timeout: float):
+        from selenium.common.exceptions import ElementClickInterceptedException
+        from selenium.webdriver.common.action_chains import ActionChains
+
+        def run():
+            el = self._element(selector, timeout, True)
+            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+            try:
+                ActionChains(self.driver).move_to_element(el).click().perform()
+            except ElementClickInterceptedException:
+                self.driver.execute_script("arguments[0].click();", el)
+
+        await asyncio.to_thread(run)
+
+    async def click_if_present(self, selector: str) -> bool:
+        from selenium.common.exceptions import WebDriverException
+        from selenium.webdriver.common.by import By
+
+        def run():
+            try:
+                self.driver.find_element(By.CSS_SELECTOR, selector).click()
+                return True
+            except WebDriverException:
+                return False
+
+        return await asyncio.to_thread(run)
+
+    async def insert_text(self, text: str):
+        await asyncio.to_thread(self.inputs.insert_text, text)
+
+    async def select_all(self):
+        await asyncio.to_thread(self.inputs.select_all)
+
+    async def set_input_value(self, selector: str, text: str, timeout: float):
+        from selenium.common.exceptions import WebDriverException
+
+        def run():
+            el = self._element(selector, timeout, True)
+            el.click()
+            try:
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            except WebDriverException:
+                pass
+            if el.get_attribute("value") != text:
+                self._script(SET_INPUT_VALUE_JS, selector, text)
+
+        await asyncio.to_thread(run)
+
+    async def read_text(self, selector: str, timeout: float) -> str:
+        from selenium.common.exceptions import TimeoutException
+
+        try:
+            return await asyncio.to_thread(self.inputs.read_text, selector, timeout)
+        except TimeoutException as e:
+            raise EngineTimeout(e.msg or f"timeout: {selector}")
+        except CdpError as e:
+            if "timeout:" in str(e):
+                raise EngineTimeout(str(e))
+            raise
+
+    def _script(self, fn: str, *args):
+        return self.driver.execute_script(f"return ({fn})(document, ...arguments);", *args)
+
+    async def evaluate(self, fn: str, *args):
+        return await asyncio.to_thread(self._script, fn, *args)
+
+    async def wait_until(self, fn: str, timeout: float, *args):
+        return await asyncio.to_thread(self._wait, timeout, lambda d: self._script(fn, *args))
+
+    async def set_files(self, selector: str, paths: list[str], timeout: float):
+        def run():
+            self._element(selector, timeout, False).send_keys("\n".join(paths))
+
+        await asyncio.to_thread(run)
+
+    async def url(self) -> str:
+        return await asyncio.to_thread(lambda: self.driver.current_url)
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float) -> str:
+        await asyncio.to_thread(self._wait, timeout, lambda d: predicate(d.current_url))
+        return await self.url()
+
+    async def close(self):
+        from selenium.common.exceptions import WebDriverException
+
+        self.inputs.close()
+        try:
+            await asyncio.to_thread(self.driver.quit)
+        except WebDriverException:
+            pass
+
+
+# ─────────────────────────────
+# DevTools 웹소켓 (드라이버 없이 이벤트 루프에서 직접)
+# ─────────────────────────────
+# mode: present(있으면) / clickable(보이고 활성) / text(innerText) / point(스크롤 후 클릭 좌표)
+WAIT_ELEMENT_JS = """(doc, selector, mode, timeoutMs) => new Promise((resolve, reject) => {
+  const started = Date.now();
+  const check = () => {
+    const el = doc && doc.querySelector(selector);
+    const ready = el && (mode === "present" || mode === "text" || (el.getClientRects().length > 0 && !el.disabled));
+    if (ready) {
+      if (mode === "text") return resolve(el.innerText || "");
+      if (mode !== "point") return resolve(true);
+      el.scrollIntoView({block: "center"});
+      const r = el.getBoundingClientRect();
+      const x = r.left + r.width / 2, y = r.top + r.height / 2;
+      const hit = doc.elementFromPoint(x, y);
+      const frame = doc.defaultView.frameElement;
+      const offset = frame ? frame.getBoundingClientRect() : {left: 0, top: 0};
+      return resolve({x: x + offset.left, y: y + offset.top, clear: !!hit && (hit === el || el.contains(hit))});
+    }
+    if (Date.now() - started > timeoutMs) return reject(new Error("timeout: " + selector));
+    setTimeout(check, 50);
+  };
+  check();
+})"""
+
+WAIT_FRAME_JS = """(doc, selector, timeoutMs) => new Promise((resolve, reject) => {
+  const started = Date.now();
+  const check = () => {
+    const frame = doc.querySelector(selector);
+    const inner = frame && frame.contentDocument;
+    if (inner && inner.body && inner.readyState !== "loading" && frame.contentWindow.location.href !== "about:blank") {
+      return resolve(true);
+    }
+    if (Date.now() - started > timeoutMs) return reject(new Error("timeout: " + selector));
+    setTimeout(check, 50);
+  };
+  check();
+})"""
+
+# __PREDICATE__ 자리에 fn(doc, ...args) 를 그대로 넣어서 씀 (페이지 CSP가 eval을 막아도 동작)
+WAIT_UNTIL_JS = """(doc, args, timeoutMs) => new Promise((resolve, reject) => {
+  const started = Date.now();
+  const check = () => {
+    const value = (__PREDICATE__)(doc, ...args);
+    if (value) return resolve(value);
+    if (Date.now() - started > timeoutMs) return reject(new Error("timeout: 조건"));
+    setTimeout(check, 50);
+  };
+  check();
+})"""
+
+# 네이티브 value setter로 값을 넣고 input/change 이벤트 발생 (Input.insertText가 안 먹었을 때)
+SET_INPUT_VALUE_JS = """(doc, selector, value) => {
+  const el = doc.querySelector(selector);
+  const setter = Object.getOwnPropertyDescriptor(doc.defaultView.HTMLInputElement.prototype, 'value').set;
+  setter.call(el, value);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+}"""
+
+INPUT_VALUE_JS = "(doc, selector) => doc.querySelector(selector).value"
+
+CLICK_JS = "(doc, selector) => { const el = doc.querySelector(selector); if (!el) return false; el.click(); return true; }"
+
+
+def find_chrome() -> str:
+    for name in (os.getenv("CHROME_PATH"), "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+        if name and (shutil.which(name) or os.path.exists(name)):
+            return shutil.which(name) or name
+    raise EngineError("Chrome 실행 파일을 찾지 못함 (CHROME_PATH 지정)")
+
+
+class CdpBrowser:
+    """
+    Chrome 하나와 DevTools 웹소켓 하나
+    탭마다 flatten 세션을 붙여 같은 연결로 여러 탭에 명령을 보내고, 응답은 id로 찾아 돌려줌
+    """
+
+    def __init__(self, ws, process=None, user_data_dir: Optional[str] = None):
+        self.ws = ws
+        self.process = process
+        self.user_data_dir = user_data_dir
+        self.next_id = 0
+        self.pending: dict[int, asyncio.Future] = {}
+        self.logged_in = False
+        self.reader = asyncio.get_running_loop().create_task(self._read())
+
+    @staticmethod
+    def _websockets():
+        try:
+            import websockets
+        except ImportError:
+            raise EngineError("EDITOR_ENGINE=cdp-async 에는 websockets 패키지가 필요함 (pip install websockets)")
+        return websockets
+
+    @classmethod
+    async def launch(cls, chrome_path: Optional[str] = None, headless: bool = False, extra_args: tuple = ()) -> "CdpBrowser":
+        websockets = cls._websockets()
+        user_data_dir = tempfile.mkdtemp(prefix="cdp-engine-")
+        args = [
+            chrome_path or find_chrome(),
+            "--remote-debugging-port=0",
+            f"--user-data-dir={user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--window-size=1600,950",
+            # 탭마다 창을 따로 띄우지만 가려지거나 포커스가 없는 창도 타이머/렌더링을 늦추지 않도록
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-backgrounding-occluded-windows",
+            *(["--headless=new"] if headless else []),
+            *extra_args,
+            "about:blank",
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        while True:
+            line = await asyncio.wait_for(process.stderr.readline(), timeout=30)
+            if not line:
+                raise EngineError("Chrome이 DevTools 주소를 알리기 전에 종료됨")
+            match = re.search(rb"DevTools listening on (ws://\S+)", line)
+            if match:
+                break
+        # stderr를 계속 비워야 파이프가 차서 Chrome이 멈추지 않음
+        asyncio.get_running_loop().create_task(cls._drain(process.stderr))
+        ws = await websockets.connect(match.group(1).decode(), max_size=None, ping_interval=None)
+        return cls(ws, process, user_data_dir)
+
+    @staticmethod
+    async def _drain(stream):
+        while await stream.readline():
+            pass
+
+    async def _read(self):
+        try:
+            async for raw in self.ws:
+                msg = json.loads(raw)
+                future = self.pending.pop(msg["id"], None) if "id" in msg else None
+                if future is not None and not future.done():
+                    future.set_result(msg)
+                # 이벤트는 구독하지 않으므로 버림
+        except Exception:
+            pass
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(EngineError("DevTools 연결 끊김"))
+            self.pending.clear()
+
+    async def batch(self, commands: list, session_id: Optional[str] = None, timeout: float = 30) -> list[dict]:
+        """[(method, params), ...] 를 순서대로 보내고 응답을 모두 기다려 보낸 순서대로 반환"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for method, params in commands:
+            self.next_id += 1
+            msg = {"id": self.next_id, "method": method, "params": params}
+            if session_id:
+                msg["sessionId"] = session_id
+            future = loop.create_future()
+            self.pending[self.next_id] = future
+            futures.append((method, self.next_id, future))
+            await self.ws.send(json.dumps(msg, ensure_ascii=False))
+        results = []
+        for method, msg_id, future in futures:
+            try:
+                reply = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self.pending.pop(msg_id, None)
+                raise EngineTimeout(f"{method} 응답 없음")
+            if "error" in reply:
+                raise EngineError(f"{method}: {reply['error'].get('message')}")
+            results.append(reply.get("result", {}))
+        return results
+
+    async def send(self, method: str, params: Optional[dict] = None, session_id: Optional[str] = None, timeout: float = 30) -> dict:
+        (result,) = await self.batch([(method, params or {})], session_id, timeout)
+        return result
+
+    async def new_tab(self) -> "CdpEngine":
+        """슬롯마다 새 창 (같은 창의 뒤쪽 탭은 숨겨진 탭이라 타이머가 느려지고 입력/포커스가 불안정)"""
+        target = await self.send("Target.createTarget", {"url": "about:blank", "newWindow": True})
+        attached = await self.send("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        return CdpEngine(self, target["targetId"], attached["sessionId"])
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    async def close(self):
+        try:
+            await self.send("Browser.close", timeout=5)
+        except EngineError:
+            pass
+        await self.ws.close()
+        if self.process is not None:
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                self.process.kill()
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class CdpEngine(EditorEngine):
+    """브라우저의 탭 하나. 같은 CdpBrowser의 탭끼리는 연결을 공유하고 서로 막지 않음"""
+
+    name = "cdp-async"
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.browser.pid  # 모든 탭이 같은 Chrome (메모리 감시는 memory_mb로 탭별)
+
+    def __init__(self, browser: CdpBrowser, target_id: str, session_id: str):
+        self.browser = browser
+        self.target_id = target_id
+        self.session_id = session_id
+        self.frame: Optional[str] = None  # 들어가 있는 iframe selector (None이면 최상위)
+
+    def _document(self) -> str:
+        if self.frame is None:
+            return "document"
+        return f"((document.querySelector({json.dumps(self.frame)}) || {{}}).contentDocument || null)"
+
+    async def _batch(self, commands: list, timeout: float = 30) -> list[dict]:
+        return await self.browser.batch(commands, self.session_id, timeout)
+
+    async def evaluate(self, fn: str, *args, timeout: float = 30):
+        expression = f"({fn})({self._document()}, ...{json.dumps(list(args), ensure_ascii=False)})"
+        (result,) = await self._batch([("Runtime.evaluate", {
+            "expression": expression, "returnByValue": True, "awaitPromise": True,
+        })], timeout=timeout + 5)
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            message = (details.get("exception") or {}).get("description") or details.get("text") or ""
+            if "timeout:" in message:
+                raise EngineTimeout(message)
+            raise EngineError(f"스크립트 오류: {message}")
+        return result.get("result", {}).get("value")
+
+    async def goto(self, url: str):
+        self.frame = None
+        await self._batch([("Page.navigate", {"url": url})])
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                if await self.evaluate("doc => doc.readyState", timeout=5) != "loading":
+                    return
+            except EngineTimeout:
+                raise
+            except EngineError:
+                pass  # 이동 중이라 실행 컨텍스트가 바뀌는 중
+            if time.monotonic() > deadline:
+                raise EngineTimeout(f"페이지 로드: {url}")
+            await asyncio.sleep(0.05)
+
+    async def enter_frame(self, selector: str, timeout: float):
+        self.frame = None
+        await self.evaluate(WAIT_FRAME_JS, selector, int(timeout * 1000), timeout=timeout)
+        self.frame = selector
+
+    async def wait_for(self, selector: str, timeout: float, clickable: bool = False):
+        mode = "clickable" if clickable else "present"
+        await self.evaluate(WAIT_ELEMENT_JS, selector, mode, int(timeout * 1000), timeout=timeout)
+
+    async def click(self, selector: str, timeout: float):
+        point = await self.evaluate(WAIT_ELEMENT_JS, selector, "point", int(timeout * 1000), timeout=timeout)
+        if not point["clear"]:
+            await self.evaluate(CLICK_JS, selector)
+            return
+        mouse = {"x": point["x"], "y": point["y"], "button": "left", "clickCount": 1}
+        await self._batch([
+            ("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": point["x"], "y": point["y"]}),
+            ("Input.dispatchMouseEvent", {"type": "mousePressed", **mouse}),
+            ("Input.dispatchMouseEvent", {"type": "mouseReleased", **mouse}),
+        ])
+
+    async def click_if_present(self, selector: str) -> bool:
+        return bool(await self.evaluate(CLICK_JS, selector))
+
+    async def wait_until(self, fn: str, timeout: float, *args):
+        script = WAIT_UNTIL_JS.replace("__PREDICATE__", fn)
+        return await self.evaluate(script, list(args), int(timeout * 1000), timeout=timeout)
+
+    async def set_files(self, selector: str, paths: list[str], timeout: float):
+        await self.wait_for(selector, timeout)
+        (found,) = await self._batch([("Runtime.evaluate", {
+            "expression": f"{self._document()}.querySelector({json.dumps(selector)})",
+        })])
+        await self._batch([("DOM.setFileInputFiles", {"files": paths, "objectId": found["result"]["objectId"]})])
+
+    async def insert_text(self, text: str):
+        commands = []
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                commands.append(("Input.dispatchKeyEvent", {
+                    "type": "keyDown", "key": "Enter", "code": "Enter", "windowsVirtualKeyCode": 13, "text": "\r",
+                }))
+                commands.append(("Input.dispatchKeyEvent", {
+                    "type": "keyUp", "key": "Enter", "code": "Enter", "windowsVirtualKeyCode": 13,
+                }))
+            if line:
+                commands.append(("Input.insertText", {"text": line}))
+        if commands:
+            await self._batch(commands)
+
+    async def select_all(self):
+        key = {"key": "a", "code": "KeyA", "windowsVirtualKeyCode": 65, "modifiers": 2}
+        await self._batch([
+            ("Input.dispatchKeyEvent", {"type": "keyDown", **key, "commands": ["selectAll"]}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", **key}),
+        ])
+
+    async def set_input_value(self, selector: str, text: str, timeout: float):
+        await self.click(selector, timeout)
+        await self._batch([("Input.insertText", {"text": text})])
+        if await self.evaluate(INPUT_VALUE_JS, selector) != text:
+            await self.evaluate(SET_INPUT_VALUE_JS, selector, text)
+
+    async def read_text(self, selector: str, timeout: float) -> str:
+        return await self.evaluate(WAIT_ELEMENT_JS, selector, "text", int(timeout * 1000), timeout=timeout) or ""
+
+    async def url(self) -> str:
+        (result,) = await self._batch([("Runtime.evaluate", {"expression": "location.href", "returnByValue": True})])
+        return result.get("result", {}).get("value") or ""
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float) -> str:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                url = await self.url()
+                if predicate(url):
+                    return url
+            except EngineError:
+                pass  # 이동 중
+            if time.monotonic() > deadline:
+                raise EngineTimeout("URL 변경 대기 시간 초과")
+            await asyncio.sleep(0.1)
+
+    async def memory_mb(self) -> Optional[float]:
+        """이 탭 렌더러의 JS 힙 크기 (공유 Chrome 전체 RSS가 아니라 탭별로 재생성 여부를 판단)"""
+        _, result = await self._batch([("Performance.enable", {}), ("Performance.getMetrics", {})], timeout=5)
+        metrics = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        if "JSHeapTotalSize" not in metrics:
+            return None
+        return round(metrics["JSHeapTotalSize"] / 1024 / 1024, 1)
+
+    async def close(self):
+        try:
+            await self.browser.send("Target.closeTarget", {"targetId": self.target_id}, timeout=5)
+        except EngineError:
+            pass
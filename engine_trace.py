@@ -0,0 +1,236 @@
+# engine_trace.py
+# 작업마다 에디터 엔진 명령(명령, selector, 인자, 시작 시각/걸린 시간, 결과 요약)과 끝난 뒤 DOM 스냅샷을 기록하고
+# 기록한 명령을 다른 엔진(보통 가짜 에디터를 띄운 브라우저)에서 그대로 다시 실행
+# - 서버: TRACE_DIR를 지정하면 드라이버를 빌린 작업마다 JSON 파일 하나 저장
+# - 재생/비교: trace_replay.py
+
+import json
+import os
+import re
+import time
+from datetime import datetime
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from editor_engines import EditorEngine
+
+
+SNAPSHOT_JS = "doc => doc.documentElement ? doc.documentElement.outerHTML : ''"
+
+# evaluate / wait_until 인자 중 CSS selector로 보이는 것(태그/클래스/id/속성 조각과 결합자만 있는 ASCII 문자열)만
+# 그대로 두고(재생 때 같은 요소를 찾아야 하므로) 나머지 문자열은 짧아도 가림
+SELECTOR_PART = r"(?:[A-Za-z][A-Za-z0-9-]*)?(?:[.#][A-Za-z0-9_-]+|\[[^\]\n]+\])+"
+SELECTOR_RE = re.compile(rf"{SELECTOR_PART}(?:\s*[>+~ ]\s*{SELECTOR_PART})*")
+
+
+def looks_like_selector(value: str) -> bool:
+    return SELECTOR_RE.fullmatch(value) is not None
+
+
+def redact_text(text: str) -> str:
+    """글자 수와 줄바꿈은 유지하고 내용만 x로 (재생 시 입력 길이/Enter 횟수가 같도록)"""
+    return re.sub(r"\S", "x", text)
+
+
+def redact_markup(text: str) -> str:
+    """태그는 남기고 태그 밖 글자만 x로 (붙여넣기 HTML / DOM 스냅샷)"""
+    return re.sub(r"(<[^>]*>)|\S", lambda m: m.group(1) or "x", text)
+
+
+def summarize(value):
+    """결과는 크기/종류만 (본문이 그대로 남지 않도록)"""
+    if isinstance(value, str):
+        return {"chars": len(value)}
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return {"type": type(value).__name__}
+
+
+def left_editor(url: str) -> bool:
+    """publish_post의 발행 완료 조건과 같음 (글쓰기/편집 화면을 벗어났는지)"""
+    return "GoBlogWrite" not in url and "postwrite" not in url.lower()
+
+
+class TracingEngine(EditorEngine):
+    """다른 엔진을 감싸 호출을 그대로 넘기면서 명령 기록을 남김 (작업 하나 동안만 사용)"""
+
+    def __init__(self, inner: EditorEngine, redact: bool = True):
+        self.inner = inner
+        self.name = inner.name
+        self.inputs = inner.inputs
+        self.redact = redact
+        self.commands: list[dict] = []
+        self.started = time.monotonic()
+        self.started_at = datetime.now()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.inner.pid
+
+    def _arg(self, value):
+        if self.redact and isinstance(value, str) and not looks_like_selector(value):
+            return redact_markup(value)
+        return value
+
+    async def _run(self, cmd: str, args: dict, coro):
+        start = time.monotonic()
+        entry = {"cmd": cmd, "args": args, "t_ms": round((start - self.started) * 1000, 1)}
+        try:
+            result = await coro
+        except Exception as e:
+            entry.update(dur_ms=round((time.monotonic() - start) * 1000, 1), ok=False, error=f"{type(e).__name__}: {e}")
+            self.commands.append(entry)
+            raise
+        entry.update(dur_ms=round((time.monotonic() - start) * 1000, 1), ok=True, result=summarize(result))
+        self.commands.append(entry)
+        return result
+
+    async def goto(self, url: str):
+        return await self._run("goto", {"url": url}, self.inner.goto(url))
+
+    async def enter_frame(self, selector: str, timeout: float):
+        return await self._run("enter_frame", {"selector": selector, "timeout": timeout}, self.inner.enter_frame(selector, timeout))
+
+    async def wait_for(self, selector: str, timeout: float, clickable: bool = False):
+        args = {"selector": selector, "timeout": timeout, "clickable": clickable}
+        return await self._run("wait_for", args, self.inner.wait_for(selector, timeout, clickable))
+
+    async def click(self, selector: str, timeout: float):
+        return await self._run("click", {"selector": selector, "timeout": timeout}, self.inner.click(selector, timeout))
+
+    async def click_if_present(self, selector: str) -> bool:
+        return await self._run("click_if_present", {"selector": selector}, self.inner.click_if_present(selector))
+
+    async def insert_text(self, text: str):
+        args = {"text": redact_text(text) if self.redact else text}
+        return await self._run("insert_text", args, self.inner.insert_text(text))
+
+    async def select_all(self):
+        return await self._run("select_all", {}, self.inner.select_all())
+
+    async def set_input_value(self, selector: str, text: str, timeout: float):
+        # 로그인 정보가 들어오므로 redact 설정과 상관없이 항상 가림
+        args = {"selector": selector, "text": redact_text(text), "timeout": timeout}
+        return await self._run("set_input_value", args, self.inner.set_input_value(selector, text, timeout))
+
+    async def read_text(self, selector: str, timeout: float) -> str:
+        return await self._run("read_text", {"selector": selector, "timeout": timeout}, self.inner.read_text(selector, timeout))
+
+    async def evaluate(self, fn: str, *args):
+        traced = {"fn": fn, "args": [self._arg(a) for a in args]}
+        return await self._run("evaluate", traced, self.inner.evaluate(fn, *args))
+
+    async def wait_until(self, fn: str, timeout: float, *args):
+        traced = {"fn": fn, "timeout": timeout, "args": [self._arg(a) for a in args]}
+        return await self._run("wait_until", traced, self.inner.wait_until(fn, timeout, *args))
+
+    async def set_files(self, selector: str, paths: list[str], timeout: float):
+        args = {"selector": selector, "files": [os.path.basename(p) for p in paths], "timeout": timeout}
+        return await self._run("set_files", args, self.inner.set_files(selector, paths, timeout))
+
+    async def url(self) -> str:
+        return await self._run("url", {}, self.inner.url())
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float) -> str:
+        return await self._run("wait_for_url", {"timeout": timeout}, self.inner.wait_for_url(predicate, timeout))
+
+    async def close(self):
+        await self.inner.close()
+
+    async def snapshot(self, max_chars: int) -> dict:
+        """지금 프레임의 DOM과 URL (기록에 넣지 않음)"""
+        html = await self.inner.evaluate(SNAPSHOT_JS) or ""
+        if self.redact:
+            html = redact_markup(html)
+        return {"url": await self.inner.url(), "chars": len(html), "html": html[:max_chars]}
+
+    def save(self, directory: str, meta: dict, snapshot: Optional[dict] = None) -> str:
+        """시작 시각 순으로 정렬되는 파일 이름으로 저장하고 경로 반환"""
+        os.makedirs(directory, exist_ok=True)
+        label = re.sub(r"[^\w.-]", "_", str(meta.get("op_id") or "op"))
+        path = os.path.join(directory, f"{self.started_at:%Y%m%d-%H%M%S-%f}-{label}.json")
+        trace = {
+            **meta,
+            "engine": self.name,
+            "started_at": self.started_at.isoformat(timespec="milliseconds"),
+            "total_ms": round((time.monotonic() - self.started) * 1000, 1),
+            "redacted": self.redact,
+            "commands": self.commands,
+            "snapshot": snapshot,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False)
+        return path
+
+
+def load_trace(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def replay_trace(
+    trace: dict,
+    engine: EditorEngine,
+    map_url: Callable[[str], str] = lambda url: url,
+    files_dir: str = ".",
+) -> list[dict]:
+    """
+    기록된 명령을 순서대로 engine에서 다시 실행하고 명령별 (cmd, dur_ms, ok) 반환
+    - 기록 당시 실패한 명령(팝업이 안 떠서 타임아웃 등)은 재생에서도 실패해도 그대로 진행
+    - goto URL은 map_url로 바꿔서(가짜 에디터 주소 등), set_files는 files_dir의 같은 이름 파일로
+    """
+    results = []
+    for entry in trace["commands"]:
+        cmd, args = entry["cmd"], entry["args"]
+        if cmd == "goto":
+            coro = engine.goto(map_url(args["url"]))
+        elif cmd == "enter_frame":
+            coro = engine.enter_frame(args["selector"], args["timeout"])
+        elif cmd == "wait_for":
+            coro = engine.wait_for(args["selector"], args["timeout"], args.get("clickable", False))
+        elif cmd == "click":
+            coro = engine.click(args["selector"], args["timeout"])
+        elif cmd == "click_if_present":
+            coro = engine.click_if_present(args["selector"])
+        elif cmd == "insert_text":
+            coro = engine.insert_text(args["text"])
+        elif cmd == "select_all":
+            coro = engine.select_all()
+        elif cmd == "set_input_value":
+            coro = engine.set_input_value(args["selector"], args["text"], args["timeout"])
+        elif cmd == "read_text":
+            coro = engine.read_text(args["selector"], args["timeout"])
+        elif cmd == "evaluate":
+            coro = engine.evaluate(args["fn"], *args["args"])
+        elif cmd == "wait_until":
+            coro = engine.wait_until(args["fn"], args["timeout"], *args["args"])
+        elif cmd == "set_files":
+            coro = engine.set_files(args["selector"], [os.path.join(files_dir, name) for name in args["files"]], args["timeout"])
+        elif cmd == "url":
+            coro = engine.url()
+        elif cmd == "wait_for_url":
+            coro = engine.wait_for_url(left_editor, args["timeout"])
+        else:
+            raise ValueError(f"알 수 없는 명령: {cmd}")
+
+        start = time.monotonic()
+        ok = True
+        try:
+            await coro
+        except Exception:
+            ok = False
+            if entry["ok"]:
+                raise
+        results.append({"cmd": cmd, "dur_ms": round((time.monotonic() - start) * 1000, 1), "ok": ok})
+    return results
+
+
+def fake_editor_url(port: int) -> Callable[[str], str]:
+    """네이버 URL의 경로/쿼리는 그대로 두고 호스트만 로컬 가짜 에디터로"""
+    def map_url(url: str) -> str:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return url
+        return parsed._replace(scheme="http", netloc=f"127.0.0.1:{port}").geturl()
+
+    return map_url
@@ -0,0 +1,196 @@
+# fake_naver_editor.py
+# 부하 테스트 / 리플레이 벤치마크용 로컬 가짜 네이버 로그인 + 스마트에디터
+# 서버가 쓰는 셀렉터(iframe#mainFrame, .se-section-text, .save_btn__bzc5B 등)만 흉내냄
+#
+# 실행:  python fake_naver_editor.py --port 8765 [--latency-ms 50]
+# 서버:  BLOG_WRITE_URL=http://127.0.0.1:8765/GoBlogWrite.naver
+#        NAVER_LOGIN_URL=http://127.0.0.1:8765/nidlogin.login
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+LOGIN_HTML = """<!doctype html><html><body>
+<input id="id"><input id="pw" type="password">
+<button id="log.login" onclick="location.href='/'">로그인</button>
+</body></html>"""
+
+TOP_HTML = """<!doctype html><html><body style="margin:0">
+<iframe id="mainFrame" src="/editor?{query}" style="width:100%;height:900px;border:0"></iframe>
+</body></html>"""
+
+VIEW_HTML = """<!doctype html><html><body><h1>발행된 글 {log_no}</h1></body></html>"""
+
+EDITOR_HTML = r"""<!doctype html><html><head><meta charset="utf-8"><style>
+.se-section-documentTitle, .se-section-text { min-height: 40px; border: 1px solid #ccc; margin: 8px; padding: 4px; white-space: pre-wrap; }
+.se-section-text { min-height: 400px; }
+.se-popup-dim { position: fixed; inset: 0; background: rgba(0,0,0,.3); }
+.se-popup { position: fixed; top: 40%; left: 40%; background: #fff; padding: 16px; }
+.layer { display: none; }
+</style></head><body>
+<button class="se-image-toolbar-button">사진</button>
+<button class="save_btn__bzc5B">저장</button>
+<button class="publish_btn__m9KHH">발행</button>
+<div class="layer" id="publishLayer"><button class="confirm_btn__WEaBq">발행 확인</button></div>
+<div class="se-section-documentTitle" contenteditable="true"></div>
+<div class="se-section-text" contenteditable="true"></div>
+<div id="toast"></div>
+<script>
+const params = new URLSearchParams(location.search);
+let logNo = params.get('logNo');
+const title = document.querySelector('.se-section-documentTitle');
+const body = document.querySelector('.se-section-text');
+
+function api(path, data) {
+  return fetch(path, {method: 'POST', body: JSON.stringify(data)}).then(r => r.json());
+}
+
+if (logNo) {
+  fetch('/api/post/' + logNo).then(r => r.json()).then(p => { title.innerText = p.title || ''; body.innerText = p.body || ''; });
+} else {
+  // 실제 에디터처럼 '이어쓰기' 팝업이 잠깐 뒤에 뜸
+  setTimeout(() => {
+    const dim = document.createElement('div'); dim.className = 'se-popup-dim';
+    const pop = document.createElement('div'); pop.className = 'se-popup';
+    const cancel = document.createElement('button'); cancel.className = 'se-popup-button-cancel'; cancel.innerText = '취소';
+    cancel.onclick = () => { dim.remove(); pop.remove(); };
+    pop.appendChild(cancel); document.body.append(dim, pop);
+  }, 150);
+}
+
+body.addEventListener('paste', e => {
+  const html = e.clipboardData.getData('text/html');
+  if (!html) return;
+  e.preventDefault();
+  document.execCommand('insertHTML', false, html);
+});
+
+document.querySelector('.save_btn__bzc5B').onclick = () => {
+  api('/api/save', {logNo, title: title.innerText, body: body.innerText}).then(r => {
+    logNo = r.logNo;
+    parent.history.replaceState(null, '', '/PostWriteForm.naver?logNo=' + logNo);
+    const t = document.getElementById('toast');
+    t.className = 'se-toast-item__success'; t.innerText = '저장됨';
+    setTimeout(() => { t.className = ''; t.innerText = ''; }, 1000);
+  });
+};
+
+document.querySelector('.publish_btn__m9KHH').onclick = () => {
+  document.getElementById('publishLayer').style.display = 'block';
+};
+document.querySelector('.confirm_btn__WEaBq').onclick = () => {
+  api('/api/publish', {logNo, title: title.innerText, body: body.innerText}).then(r => {
+    parent.location.href = '/PostView.naver?logNo=' + r.logNo;
+  });
+};
+
+document.querySelector('.se-image-toolbar-button').onclick = () => {
+  const input = document.createElement('input');
+  input.type = 'file'; input.multiple = true;
+  input.onchange = () => {
+    for (const f of input.files) {
+      const c = document.createElement('div'); c.className = 'se-component se-image'; c.innerText = f.name;
+      body.after(c);
+    }
+  };
+  input.click();
+};
+</script></body></html>"""
+
+
+class FakeEditorState:
+    """저장/발행된 글과 호출 횟수 (테스트 결과 확인용)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.posts: dict[str, dict] = {}
+        self.next_log_no = 220000000000
+        self.counts = {"save": 0, "publish": 0, "page": 0}
+
+    def save(self, data: dict, published: bool = False) -> str:
+        with self.lock:
+            log_no = data.get("logNo")
+            if not log_no:
+                self.next_log_no += 1
+                log_no = str(self.next_log_no)
+            self.posts[log_no] = {"title": data.get("title", ""), "body": data.get("body", ""), "published": published}
+            self.counts["publish" if published else "save"] += 1
+            return log_no
+
+
+def make_handler(state: FakeEditorState, latency_ms: float):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, body: str, content_type: str = "text/html; charset=utf-8", status: int = 200):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _json(self, obj):
+            self._send(json.dumps(obj, ensure_ascii=False), "application/json")
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            with state.lock:
+                state.counts["page"] += 1
+            if url.path == "/nidlogin.login":
+                self._send(LOGIN_HTML)
+            elif url.path in ("/GoBlogWrite.naver", "/PostWriteForm.naver"):
+                self._send(TOP_HTML.format(query=url.query))
+            elif url.path == "/editor":
+                self._send(EDITOR_HTML)
+            elif url.path == "/PostView.naver":
+                self._send(VIEW_HTML.format(log_no=query.get("logNo", [""])[0]))
+            elif url.path.startswith("/api/post/"):
+                with state.lock:
+                    self._json(state.posts.get(url.path.rsplit("/", 1)[-1], {}))
+            elif url.path == "/api/stats":
+                with state.lock:
+                    self._json({**state.counts, "posts": len(state.posts)})
+            else:
+                self._send("<html><body>ok</body></html>")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            data = json.loads(self.rfile.read(length) or b"{}")
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            if self.path == "/api/save":
+                self._json({"logNo": state.save(data)})
+            elif self.path == "/api/publish":
+                self._json({"logNo": state.save(data, published=True)})
+            else:
+                self._send("not found", status=404)
+
+    return Handler
+
+
+def serve_fake_editor(port: int = 8765, latency_ms: float = 0, background: bool = False):
+    """가짜 에디터 서버 실행. background=True면 스레드로 띄우고 (server, state) 반환"""
+    state = FakeEditorState()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state, latency_ms))
+    if background:
+        threading.Thread(target=server.serve_forever, name="fake-editor", daemon=True).start()
+        return server, state
+    print(f"🧪 가짜 에디터 http://127.0.0.1:{port}/GoBlogWrite.naver")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 가짜 네이버 에디터")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="페이지/저장 응답 지연 (느린 에디터 흉내)")
+    args = parser.parse_args()
+    serve_fake_editor(args.port, args.latency_ms)
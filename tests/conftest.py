@@ -0,0 +1,64 @@
+# tests/conftest.py
+# 브라우저 없이 도는 로직(대기 통계, 속도 제한, 드라이버 풀, 매칭 등)을 시험
+# 서버 파일(찐 TEST10)은 확장자가 없어 경로로 직접 불러오고, 상태 파일은 임시 폴더에 둠
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = tempfile.mkdtemp(prefix="naver-server-test-")
+
+os.environ.update({
+    "DRIVER_WARMUP": "0",
+    "JOURNAL_REPLAY": "0",
+    "JOURNAL_FILE": os.path.join(STATE_DIR, "operations.journal"),
+    "POST_INDEX_DB": os.path.join(STATE_DIR, "post_index.db"),
+    "PUBLISH_SCHEDULE_FILE": os.path.join(STATE_DIR, "publish_schedule.json"),
+    "BROWSER_PID_FILE": os.path.join(STATE_DIR, "browser_pids.json"),
+    "IMAGE_CACHE_DIR": os.path.join(STATE_DIR, "image_cache"),
+    "TRACE_DIR": "",
+})
+sys.path.insert(0, ROOT)
+
+
+def load_server():
+    loader = importlib.machinery.SourceFileLoader("naver_server", os.path.join(ROOT, "찐 TEST10"))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+server_module = load_server()
+
+
+@pytest.fixture
+def server():
+    return server_module
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_drivers(server, monkeypatch):
+    """Chrome 대신 빈 엔진을 띄우는 드라이버 풀 (크기는 호출할 때)"""
+    def make(size: int = 1):
+        def start_driver(slot):
+            slot.engine = object()
+            slot.wait = object()
+
+        pool = server.DriverPool(size)
+        monkeypatch.setattr(server, "driver_pool", pool)
+        monkeypatch.setattr(server, "start_driver", start_driver)
+        return pool
+
+    return make
@@ -0,0 +1,79 @@
+# tests/test_admission.py
+# 동시 브라우저 작업 수 한도 AIMD: 느리거나 실패하면 곱으로 줄이고, 성공하면 조금씩 늘림
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def admission(server, monkeypatch):
+    monkeypatch.setattr(server, "ADMISSION_MIN_LIMIT", 1.0)
+    monkeypatch.setattr(server, "ADMISSION_BACKOFF", 0.5)
+    monkeypatch.setattr(server, "ADMISSION_COOLDOWN_SEC", 0.0)
+    return server.AdmissionController(4)
+
+
+def test_multiplicative_decrease_down_to_minimum(admission):
+    admission.on_done(slow=True, failed=False)
+    assert admission.limit == 2.0
+    admission.on_done(slow=False, failed=True)
+    assert admission.limit == 1.0
+    admission.on_done(slow=True, failed=False)
+    assert admission.limit == 1.0 and admission.decreases == 3
+
+
+def test_additive_increase_up_to_browser_count(admission):
+    admission.limit = 2.0
+    admission.on_done(slow=False, failed=False)
+    admission.on_done(slow=False, failed=False)
+    # 한도만큼(2번) 연속 성공하면 약 +1
+    assert admission.limit == pytest.approx(2.0 + 1 / 2 + 1 / 2.5)
+    for _ in range(50):
+        admission.on_done(slow=False, failed=False)
+    assert admission.limit == 4.0
+    assert admission.allows(3) and not admission.allows(4)
+
+
+def test_cooldown_limits_to_one_decrease(server, monkeypatch):
+    monkeypatch.setattr(server, "ADMISSION_COOLDOWN_SEC", 60.0)
+    admission = server.AdmissionController(4)
+    admission.on_done(slow=True, failed=False)
+    admission.on_done(slow=True, failed=False)
+    assert admission.decreases == 1 and admission.limit == 4 * server.ADMISSION_BACKOFF
+
+
+def test_slow_stage_waits_shrink_the_pool_limit(server, fake_drivers, admission):
+    pool = fake_drivers(2)  # 한도는 브라우저 수(2)에서 시작
+    for slot in pool.slots:
+        slot.engine, slot.wait = object(), object()
+
+    slot = pool.acquire()
+    slot.stage_waits, slot.slow_waits = 4, 2  # 단계 대기의 절반이 느렸음
+    pool.release(slot)
+    assert pool.admission_snapshot()["effective_limit"] == 1
+
+    # 한도가 1이면 브라우저가 비어 있어도 두 번째 요청은 기다림
+    first = pool.acquire()
+    got = []
+    thread = threading.Thread(target=lambda: got.append(pool.acquire()))
+    thread.start()
+    time.sleep(0.05)
+    assert got == []
+    pool.release(first)
+    thread.join(1)
+    assert len(got) == 1
+    pool.release(got[0])
+
+
+def test_internal_work_bypasses_the_limit(fake_drivers, admission):
+    pool = fake_drivers(2)
+    pool.admission = admission
+    admission.limit = 1.0
+    first = pool.acquire()
+    # slot을 지정한 내부 작업(저장 모으기, 재생성)은 한도와 상관없이 그 브라우저를 받음
+    other = next(slot for slot in pool.slots if slot is not first)
+    assert pool.acquire(slot=other) is other
+    pool.release(other)
+    pool.release(first)
@@ -0,0 +1,75 @@
+# tests/test_bulk.py
+# 대량 생성: 끝나는 순서대로 결과, next_offset은 앞에서부터 빠짐없이 끝난 레코드 수, 같은 bulk_id로 이어 보내기
+
+import json
+import time
+import uuid
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def bulk_app(server, fake_drivers, monkeypatch):
+    fake_drivers(2)
+    monkeypatch.setattr(server, "rate_limiter", server.TokenBucketLimiter({}))
+    executed = []
+
+    def execute_post_action(req, images):
+        if req.title == "slow":
+            time.sleep(0.3)
+        executed.append(req.title)
+        return {"status": "success", "title": req.title}
+
+    monkeypatch.setattr(server, "execute_post_action", execute_post_action)
+    return server.app, executed
+
+
+async def post_bulk(app, titles, **params):
+    body = "\n".join(json.dumps({"action": "create", "title": t, "body": "본문"}) for t in titles) + "\n"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=30) as client:
+        response = await client.post("/post-to-naver/bulk", params=params, content=body.encode())
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+@pytest.mark.anyio
+async def test_next_offset_counts_only_the_unbroken_prefix(bulk_app):
+    app, _ = bulk_app
+    lines = await post_bulk(app, ["slow", "fast"], parallel=2)
+
+    start, *records, summary = lines
+    assert start["stage"] == "start" and start["records"] == 2
+    # 1번이 먼저 끝나도 0번이 안 끝났으면 next_offset은 그대로
+    assert [(r["index"], r["next_offset"]) for r in records] == [(1, 0), (0, 2)]
+    assert summary["next_offset"] == 2 and summary["done"] == 2
+
+
+@pytest.mark.anyio
+async def test_resend_from_next_offset_skips_and_reuses_finished(bulk_app):
+    app, executed = bulk_app
+    bulk_id = uuid.uuid4().hex
+    titles = ["a", "b", "c", "d"]
+    await post_bulk(app, titles, bulk_id=bulk_id, parallel=1)
+    assert executed == titles
+
+    # 같은 bulk_id로 offset=2부터: 앞 레코드는 건너뛰고, 이미 끝난 레코드는 다시 실행하지 않고 결과만
+    _, *records, summary = await post_bulk(app, titles, bulk_id=bulk_id, offset=2)
+    assert executed == titles
+    assert sorted(r["index"] for r in records) == [2, 3]
+    assert all(r["resumed"] and r["result"]["title"] == titles[r["index"]] for r in records)
+    assert (summary["records"], summary["resumed"], summary["next_offset"]) == (2, 2, 4)
+
+
+@pytest.mark.anyio
+async def test_invalid_record_does_not_stop_the_batch(bulk_app):
+    app, executed = bulk_app
+    body = '{"action": "create", "title": "ok", "body": "x"}\nnot json\n'
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=30) as client:
+        response = await client.post("/post-to-naver/bulk", content=body.encode())
+    _, *records, summary = [json.loads(line) for line in response.text.splitlines()]
+
+    errors = [r for r in records if r["stage"] == "error"]
+    assert [(r["index"], r["status_code"]) for r in errors] == [(1, 400)]
+    assert executed == ["ok"] and summary["next_offset"] == 2
@@ -0,0 +1,164 @@
+# tests/test_driver_pool.py
+# 드라이버 풀: 글이 열린 브라우저 고르기, 우선순위 레인, 줄 선 요청이 워커 스레드를 붙잡지 않는지
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+
+@pytest.mark.anyio
+async def test_interactive_edit_not_starved_by_rate_limited_bulk_creates(server, fake_drivers, monkeypatch):
+    """
+    create 속도 제한(분당 6, 버스트 1)에 걸린 bulk create 45개가 줄 서 있어도
+    interactive edit는 워커 스레드(기본 40개)를 기다리지 않고 바로 브라우저를 받음
+    """
+    fake_drivers(1)
+    monkeypatch.setattr(server, "rate_limiter", server.TokenBucketLimiter({"create": (6 / 60, 1), "edit": (30 / 60, 5)}))
+
+    def run_post_action(req, images):
+        with server.lease_driver(session_id=req.session_id, priority=server.request_priority(req)):
+            time.sleep(0.05)
+        return {"status": req.action}
+
+    monkeypatch.setattr(server, "run_post_action", run_post_action)
+
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=30) as client:
+        bulk = [
+            asyncio.create_task(client.post("/post-to-naver", json={
+                "action": "create", "title": f"b{i}", "body": "본문", "priority": "bulk",
+            }))
+            for i in range(45)
+        ]
+        await asyncio.sleep(0.5)
+        start = time.monotonic()
+        response = await asyncio.wait_for(
+            client.post("/post-to-naver", json={"action": "edit", "directive": "append", "replacement": "추가"}),
+            timeout=10,
+        )
+        elapsed = time.monotonic() - start
+
+        for task in bulk:
+            task.cancel()
+        for task in list(server.background_tasks):
+            task.cancel()
+        await asyncio.gather(*bulk, *server.background_tasks, return_exceptions=True)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "edit"
+    assert elapsed < 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_async_waiter_leaves_lane(server, fake_drivers):
+    """이벤트 루프에서 기다리다 취소된 요청은 레인에서 빠지고 브라우저를 붙잡지 않음"""
+    pool = fake_drivers(1)
+    held = pool.acquire(lane="normal")
+    waiter = asyncio.create_task(pool.acquire_async(lane="bulk"))
+    await asyncio.sleep(0.05)
+    assert len(pool.lanes["bulk"]) == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert len(pool.lanes["bulk"]) == 0
+
+    pool.release(held)
+    again = await asyncio.wait_for(pool.acquire_async(lane="interactive"), timeout=1)
+    assert again is held
+    pool.release(again)
+
+
+def test_session_goes_back_to_the_browser_that_has_it_open(fake_drivers):
+    pool = fake_drivers(2)
+    first, second = pool.slots
+    for slot in pool.slots:
+        slot.engine, slot.wait = object(), object()
+    second.open_session_id = "s1"
+    first.last_used, second.last_used = 1.0, 2.0
+
+    # 다른 글은 오래 안 쓴 브라우저로, 같은 글은 열려 있는 브라우저로
+    assert pool.acquire(session_id="s2") is first
+    assert pool.acquire(session_id="s1") is second
+    pool.release(first)
+    pool.release(second)
+
+
+def test_open_session_waits_for_its_browser_even_if_another_is_free(fake_drivers):
+    pool = fake_drivers(2)
+    first, second = pool.slots
+    for slot in pool.slots:
+        slot.engine, slot.wait = object(), object()
+    second.open_session_id = "s1"
+    held = pool.acquire(slot=second)
+
+    got = []
+    thread = threading.Thread(target=lambda: got.append(pool.acquire(session_id="s1")))
+    thread.start()
+    time.sleep(0.05)
+    assert got == []  # 저장 안 된 수정을 덮어쓰지 않도록 쉬는 first는 쓰지 않음
+
+    pool.release(held)
+    thread.join(1)
+    assert got == [second]
+    pool.release(second)
+
+
+def test_request_without_session_uses_most_recent_warm_browser(fake_drivers):
+    pool = fake_drivers(3)
+    cold, older, recent = pool.slots
+    older.engine, older.wait = object(), object()
+    recent.engine, recent.wait = object(), object()
+    older.last_used, recent.last_used = 1.0, 2.0
+
+    slot = pool.acquire(create=False)
+    assert slot is recent
+    pool.release(slot)
+
+
+def queue_and_drain(pool, lanes: dict[str, int]) -> list[str]:
+    """브라우저 하나를 잡아둔 채 레인별로 줄을 세운 뒤 풀어서 배정 순서를 봄"""
+    held = pool.acquire(lane="normal")
+    order = []
+
+    def work(lane):
+        slot = pool.acquire(lane=lane)
+        order.append(lane)
+        pool.release(slot)
+
+    threads = [threading.Thread(target=work, args=(lane,)) for lane, n in lanes.items() for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while sum(map(len, pool.lanes.values())) < len(threads) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    pool.release(held)
+    for thread in threads:
+        thread.join(2)
+    return order
+
+
+def test_lanes_share_the_browser_by_weight(server, fake_drivers):
+    pool = fake_drivers(1)
+    order = queue_and_drain(pool, {"interactive": 16, "normal": 16, "bulk": 16})
+
+    # 한 바퀴(가중치 합 8 + 3 + 1 = 12번)마다 가중치 비율대로, bulk도 굶지 않음
+    # (잡아둔 브라우저도 normal 차례 하나를 써서 ±1)
+    first_round = order[:12]
+    for lane, weight in server.PRIORITY_WEIGHTS.items():
+        assert abs(first_round.count(lane) - weight) <= 1, first_round
+    assert "bulk" in first_round
+    assert sorted(order) == sorted(["interactive"] * 16 + ["normal"] * 16 + ["bulk"] * 16)
+    assert pool.snapshot()["lanes"]["bulk"]["granted"] == 16
+
+
+def test_idle_lane_does_not_catch_up_in_a_burst(fake_drivers):
+    pool = fake_drivers(1)
+    queue_and_drain(pool, {"normal": 30})  # normal만 한참 받아 pass가 앞서감
+    order = queue_and_drain(pool, {"interactive": 8, "normal": 8})
+
+    # 쉬다 온 interactive는 밀린 몫을 몰아서 받지 않고 지금부터 가중치 비율대로
+    assert "normal" in order[:6]
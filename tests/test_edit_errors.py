@@ -0,0 +1,58 @@
+# tests/test_edit_errors.py
+# append / replace 중 난 데드라인 초과·요청 오류는 500으로 감싸지 않고 그대로 (504 / 4xx)
+
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+
+class SlowEditor:
+    """본문 읽기가 요청 데드라인보다 오래 걸리는 에디터"""
+
+    async def read_text(self, selector, timeout):
+        await asyncio.sleep(0.1)
+        return "오늘은 카페를 다녀왔습니다."
+
+    async def click(self, selector, timeout):
+        pass
+
+    async def select_all(self):
+        pass
+
+    async def insert_text(self, text):
+        pass
+
+
+@pytest.fixture
+def short_deadline(server):
+    token = server.request_deadline.set(time.monotonic() + 0.05)
+    yield
+    server.request_deadline.reset(token)
+
+
+def test_append_keeps_deadline_error(server, short_deadline):
+    engine = SlowEditor()
+    with pytest.raises(server.RequestDeadlineExceeded) as error:
+        server.append_content(engine, server.AdaptiveWait(engine), "추가")
+    assert server.error_to_http(error.value).status_code == 504
+
+
+def test_replace_keeps_deadline_error(server, short_deadline):
+    engine = SlowEditor()
+    pairs = [server.ReplacementPair(target="카페", replacement="식당")]
+    with pytest.raises(server.RequestDeadlineExceeded):
+        server.replace_or_remove_content(engine, server.AdaptiveWait(engine), pairs, "replace", "exact")
+
+
+def test_body_read_keeps_request_errors(server, monkeypatch):
+    engine = SlowEditor()
+
+    def missing_frame(*args):
+        raise HTTPException(status_code=409, detail="편집기 없음")
+
+    monkeypatch.setattr(server.AdaptiveWait, "call", missing_frame)
+    with pytest.raises(HTTPException) as error:
+        server.append_content(engine, server.AdaptiveWait(engine), "추가")
+    assert error.value.status_code == 409
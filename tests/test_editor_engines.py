@@ -0,0 +1,50 @@
+# tests/test_editor_engines.py
+# 브라우저 없이 엔진의 CDP 명령 조립/결과 해석만 확인
+
+import pytest
+
+from editor_engines import CdpEngine, EditorEngine, SeleniumEngine
+from engine_trace import TracingEngine
+
+
+class FakeBrowser:
+    pid = 4242  # 모든 탭이 공유하는 Chrome
+
+    def __init__(self, heap_bytes):
+        self.heap_bytes = heap_bytes
+        self.sent = []
+
+    async def batch(self, commands, session_id=None, timeout=30):
+        self.sent.append((session_id, [method for method, _ in commands]))
+        return [{}, {"metrics": [{"name": "JSHeapTotalSize", "value": self.heap_bytes}]}]
+
+
+@pytest.mark.anyio
+async def test_cdp_memory_is_measured_per_tab():
+    browser = FakeBrowser(0)
+    first, second = CdpEngine(browser, "t1", "s1"), CdpEngine(browser, "t2", "s2")
+    assert first.pid == second.pid  # pid로는 탭을 구분할 수 없음
+
+    browser.heap_bytes = 300 * 1024 * 1024
+    assert await first.memory_mb() == 300.0
+    browser.heap_bytes = 40 * 1024 * 1024
+    assert await second.memory_mb() == 40.0
+    assert [session for session, _ in browser.sent] == ["s1", "s2"]
+    assert browser.sent[0][1] == ["Performance.enable", "Performance.getMetrics"]
+
+
+def test_engines_implement_the_whole_interface():
+    with pytest.raises(TypeError):
+        EditorEngine()
+
+    class Partial(EditorEngine):
+        async def goto(self, url):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+    tab = CdpEngine(FakeBrowser(0), "t1", "s1")
+    traced = TracingEngine(tab)
+    assert SeleniumEngine(driver=None).name == "selenium"
+    assert traced.pid == tab.pid
@@ -0,0 +1,49 @@
+# tests/test_engine_trace.py
+# 명령 기록: redact가 켜져 있으면 selector가 아닌 문자열 인자는 길이와 상관없이 가림
+
+import pytest
+
+from editor_engines import CdpEngine
+from engine_trace import TracingEngine, looks_like_selector
+
+
+class Browser:
+    pid = None
+
+    def __init__(self):
+        self.calls = []
+
+    async def batch(self, commands, session_id=None, timeout=30):
+        self.calls.append(commands)
+        return [{"result": {"value": 1}}]
+
+
+@pytest.mark.parametrize("value, expected", [
+    (".se-component.se-image", True),
+    ("input[type='file'][data-upload-capture]", True),
+    ("#mainFrame > .se-section-text", True),
+    ("비밀번호1234", False),
+    ("short", False),
+    ("<p>안녕</p>", False),
+    (".net 으로 시작하는 문장", False),
+])
+def test_selector_detection(value, expected):
+    assert looks_like_selector(value) is expected
+
+
+@pytest.mark.anyio
+async def test_short_text_arguments_are_redacted():
+    traced = TracingEngine(CdpEngine(Browser(), "t1", "s1"), redact=True)
+    await traced.evaluate("(doc, html, text) => 1", "<b>짧은</b>", "짧은 본문")
+    await traced.wait_until("(doc, sel, n) => 1", 1, ".se-component.se-image", 3)
+
+    evaluate, wait_until = traced.commands
+    assert evaluate["args"]["args"] == ["<b>xx</b>", "xx xx"]
+    assert wait_until["args"]["args"] == [".se-component.se-image", 3]
+
+
+@pytest.mark.anyio
+async def test_arguments_are_kept_when_redact_is_off():
+    traced = TracingEngine(CdpEngine(Browser(), "t1", "s1"), redact=False)
+    await traced.evaluate("(doc, text) => 1", "짧은 본문")
+    assert traced.commands[0]["args"]["args"] == ["짧은 본문"]
@@ -0,0 +1,72 @@
+# tests/test_journal.py
+# 작업 저널: 단계 기록과 재시작 때 다시 실행할 작업 고르기
+
+import json
+import time
+
+import pytest
+
+
+class FakeWait:
+    def call(self, stage, make):
+        return None
+
+
+@pytest.fixture
+def journal(server, monkeypatch, tmp_path):
+    journal = server.OperationJournal(str(tmp_path / "operations.journal"))
+    monkeypatch.setattr(server, "journal", journal)
+    return journal
+
+
+def write_records(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+
+
+def test_flushing_previous_draft_is_not_a_stage_of_this_op(server, journal):
+    """새 작업이 편집기를 열며 앞 글의 모아둔 수정을 저장해도 그 작업의 saved 단계로 남지 않음"""
+    slot = server.DriverSlot(0)
+    slot.saves.mark_dirty("previous-post")
+    journal.append({"op_id": "op-b", "type": "accepted", "request": {"action": "create", "title": "B", "body": "b"}})
+
+    slot_token = server.current_slot.set(slot)
+    op_token = server.current_op_id.set("op-b")
+    try:
+        assert slot.saves.flush(object(), FakeWait())
+    finally:
+        server.current_op_id.reset(op_token)
+        server.current_slot.reset(slot_token)
+
+    assert not slot.saves.dirty
+    assert journal.get("op-b")["stage"] is None
+
+
+def test_unfinished_op_without_applied_stage_is_replayed(server, journal):
+    now = time.time()
+    request = {"action": "create", "title": "x", "body": "b"}
+    write_records(journal.path, [
+        {"op_id": "fresh", "type": "accepted", "t": now, "request": request},
+        {"op_id": "fresh", "type": "stage", "t": now, "stage": "editor_open"},
+        {"op_id": "saved", "type": "accepted", "t": now, "request": request},
+        {"op_id": "saved", "type": "stage", "t": now, "stage": "saved"},
+    ])
+    pending = journal.load()
+    assert [op["op_id"] for op in pending] == ["fresh"]
+    assert journal.get("saved")["status"] == "recovered"
+
+
+def test_expired_op_is_failed_instead_of_replayed(server, journal, monkeypatch):
+    ran = []
+    monkeypatch.setattr(server, "handle_post_request", lambda req: ran.append(req.title) or {"status": "created"})
+    now = time.time()
+    request = {"action": "create", "title": "x", "body": "b"}
+    write_records(journal.path, [
+        {"op_id": "expired", "type": "accepted", "t": now, "request": {**request, "title": "expired"}, "deadline": now - 1},
+        {"op_id": "live", "type": "accepted", "t": now, "request": {**request, "title": "live"}, "deadline": now + 60},
+    ])
+    server.replay_operations(journal.load())
+    assert ran == ["live"]
+    assert journal.get("expired")["status"] == "failed"
+    assert journal.get("expired")["result"]["status_code"] == 504
+    assert journal.get("live")["status"] == "done"
@@ -0,0 +1,56 @@
+# tests/test_matching.py
+# replace/remove target 찾기: exact → normalized → fuzzy
+
+import pytest
+
+
+@pytest.fixture
+def index(server):
+    return server.BodyIndex()
+
+
+def matched(text, match):
+    return text[match["start"]:match["end"]]
+
+
+def test_exact_level_finds_only_identical_text(index):
+    text = "첫 문단입니다.\n오늘은 카페를 다녀왔습니다."
+    match = index.find(text, "카페를 다녀왔습니다", "exact")
+    assert match["mode"] == "exact" and matched(text, match) == "카페를 다녀왔습니다"
+    assert index.find(text, "카페를  다녀왔습니다", "exact") is None
+
+
+def test_normalized_level_ignores_whitespace_and_nbsp(index):
+    text = "오늘은 카페를\n다녀왔습니다."
+    match = index.find(text, "카페를 다녀왔습니다", "normalized")
+    assert match["mode"] == "normalized"
+    assert matched(text, match) == "카페를\n다녀왔습니다"
+    assert index.find(text, "카페를 다녀왔어요", "normalized") is None
+
+
+def test_fuzzy_level_covers_changed_last_character(index):
+    text = "오늘은 서울 근교의 작은 카페를 다녀왔습니당. 좋았어요"
+    match = index.find(text, "오늘은 서울 근교의 작은 카페를 다녀왔습니다", "fuzzy")
+    assert match["mode"] == "fuzzy"
+    assert matched(text, match) == "오늘은 서울 근교의 작은 카페를 다녀왔습니당"
+
+
+def test_fuzzy_level_rejects_below_confidence_floor(index):
+    text = "완전히 다른 문장이 들어 있는 본문입니다"
+    assert index.find(text, "오늘은 카페를 다녀왔습니다", "fuzzy") is None
+
+
+def test_approx_find_prefers_longer_span_on_ties(server):
+    # 'bar bax'(치환)와 'bar baxz'(삽입) 모두 거리 1 → target을 남김없이 덮는 쪽
+    assert server.approx_find("foo bar baxz qux", "bar baz", 1) == (1, 4, 12)
+    assert server.approx_find("어제 다녀왔습니당 ", "다녀왔습니다", 1) == (1, 3, 9)
+
+
+def test_approx_find_keeps_first_of_separate_matches(server):
+    assert server.approx_find("abxd abyd", "abcd", 1) == (1, 0, 4)
+
+
+def test_normalize_with_offsets_maps_back_to_original(server):
+    norm, offsets = server.normalize_with_offsets("  a  b\u200bc\n")
+    assert norm == "a bc"
+    assert offsets == [2, 3, 5, 7]
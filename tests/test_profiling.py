@@ -0,0 +1,63 @@
+# tests/test_profiling.py
+# 요청 프로파일: 토큰을 설정했을 때만, cProfile을 못 켜도 요청은 그대로, 측정 중 스레드로 등록하지 않음
+
+import httpx
+import pytest
+
+
+class BusyProfile:
+    """Python 3.12+에서 다른 스레드가 이미 cProfile을 켠 상태"""
+
+    def enable(self):
+        raise ValueError("Another profiling tool is already active")
+
+    def disable(self):
+        raise AssertionError("켜지지 않은 프로파일러를 끔")
+
+
+def test_busy_cprofile_serves_request_without_profiling(server, monkeypatch):
+    monkeypatch.setattr(server.cProfile, "Profile", BusyProfile)
+    profile = server.RequestProfile("cprofile", "POST", "/post-to-naver")
+
+    ran = []
+    with profile.scope():
+        assert not profile.threads
+        ran.append(True)
+
+    assert ran and profile.profiles == []
+    assert profile.summary()["skipped"] == 1 and not profile.summary()["running"]
+
+
+def test_cprofile_scope_records_and_unregisters(server):
+    profile = server.RequestProfile("cprofile", "POST", "/post-to-naver")
+    with profile.scope():
+        with profile.scope():  # 같은 스레드 안쪽 구간은 바깥 측정에 포함
+            sum(range(1000))
+        assert len(profile.threads) == 1
+
+    assert len(profile.profiles) == 1 and not profile.threads
+    assert profile.stats().total_calls > 0
+
+
+async def get(server, path, **headers):
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+@pytest.mark.anyio
+async def test_profiling_is_off_without_a_token(server, monkeypatch):
+    monkeypatch.setattr(server, "PROFILE_TOKEN", "")
+    response = await get(server, "/profiles", **{"X-Profile": "cprofile"})
+    assert response.status_code == 404
+    assert "X-Profile-Id" not in response.headers
+
+
+@pytest.mark.anyio
+async def test_profiling_requires_the_configured_token(server, monkeypatch):
+    monkeypatch.setattr(server, "PROFILE_TOKEN", "s3cret")
+    wrong = await get(server, "/profiles", **{"X-Profile": "cprofile", "X-Profile-Token": "nope"})
+    assert wrong.status_code == 403 and "X-Profile-Id" not in wrong.headers
+
+    right = await get(server, "/profiles", **{"X-Profile": "cprofile", "X-Profile-Token": "s3cret"})
+    assert right.status_code == 200 and "X-Profile-Id" in right.headers
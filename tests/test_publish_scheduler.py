@@ -0,0 +1,72 @@
+# tests/test_publish_scheduler.py
+# 예약 발행: 준비(임시저장)는 앞당겨도 발행 버튼은 예약 시각 이후에만
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def scheduler(server, monkeypatch, tmp_path):
+    calls = []
+
+    def handle_post_request(req):
+        calls.append((time.time(), req.action, req.session_id, req.body))
+        return {"status": "success"}
+
+    monkeypatch.setattr(server, "PUBLISH_LEAD_SEC", 0.3)
+    monkeypatch.setattr(server, "handle_post_request", handle_post_request)
+    scheduler = server.PublishScheduler(os.path.join(tmp_path, "schedule.json"))
+    scheduler.start()
+    return scheduler, calls
+
+
+def wait_status(scheduler, job_id, status, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if scheduler.jobs[job_id]["status"] == status:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"{job_id}: {scheduler.jobs[job_id]['status']} (기대: {status})")
+
+
+def test_prepares_early_and_publishes_at_slot(server, scheduler):
+    scheduler, calls = scheduler
+    publish_at = time.time() + 0.6
+    job = scheduler.schedule(server.PostRequest(
+        action="publish", body="본문", publish_at=datetime.fromtimestamp(publish_at),
+    ))
+    wait_status(scheduler, job["job_id"], "published")
+
+    (prepared_at, action, session_id, body), (published_at, publish, publish_session, publish_body) = calls
+    assert action == "create" and body == "본문" and prepared_at < publish_at
+    assert publish == "publish" and publish_body is None and publish_session == session_id
+    assert published_at >= publish_at
+
+
+def test_schedules_existing_draft_by_session_id(server, scheduler):
+    scheduler, calls = scheduler
+    server.post_index.record("draft-1", "draft", "https://blog.naver.com/PostWriteForm.naver?logNo=223000000001")
+    publish_at = time.time() + 0.4
+    job = scheduler.schedule(server.PostRequest(
+        action="publish", session_id="draft-1", publish_at=datetime.fromtimestamp(publish_at),
+    ))
+    wait_status(scheduler, job["job_id"], "published")
+
+    # 본문이 없으면 준비할 글쓰기 없이 그 시각에 발행만
+    [(published_at, action, session_id, _)] = calls
+    assert (action, session_id) == ("publish", "draft-1")
+    assert published_at >= publish_at
+
+
+def test_rejects_schedule_without_body_or_known_session(server, scheduler):
+    scheduler, _ = scheduler
+    publish_at = datetime.fromtimestamp(time.time() + 60)
+    with pytest.raises(HTTPException) as missing:
+        scheduler.schedule(server.PostRequest(action="publish", publish_at=publish_at))
+    with pytest.raises(HTTPException) as unknown:
+        scheduler.schedule(server.PostRequest(action="publish", session_id="nope", publish_at=publish_at))
+    assert (missing.value.status_code, unknown.value.status_code) == (400, 404)
@@ -0,0 +1,50 @@
+# tests/test_rate_limiter.py
+# (계정, 작업 종류)별 토큰 버킷: 버스트까지는 바로, 그 뒤로는 채워질 때까지 대기
+
+import time
+
+import pytest
+
+
+@pytest.fixture
+def limiter(server):
+    # 분당 600회(0.1초에 1개), 버스트 2
+    return server.TokenBucketLimiter({"create": (10.0, 2.0)})
+
+
+def test_burst_then_waits_for_refill(limiter):
+    assert limiter.acquire("me", "create") < 0.05
+    assert limiter.acquire("me", "create") < 0.05
+    waited = limiter.acquire("me", "create")
+    assert 0.07 <= waited < 0.5
+    assert limiter.snapshot()["wait"]["me:create"]["count"] == 3
+
+
+def test_accounts_and_unlimited_ops_do_not_wait(limiter):
+    limiter.acquire("me", "create")
+    limiter.acquire("me", "create")
+    assert limiter.acquire("other", "create") < 0.05
+    assert limiter.acquire("", "create") < 0.05  # 계정 없으면 default
+    assert limiter.acquire("me", "edit") == 0.0  # 제한 없는 작업
+    assert set(limiter.snapshot()["tokens"]) == {"me:create", "other:create", "default:create"}
+
+
+def test_gives_up_when_refill_is_past_the_deadline(server):
+    limiter = server.TokenBucketLimiter({"publish": (1 / 60, 1.0)})  # 분당 1회
+    limiter.acquire("me", "publish")
+    token = server.request_deadline.set(time.monotonic() + 1)
+    try:
+        start = time.monotonic()
+        with pytest.raises(server.RequestDeadlineExceeded):
+            limiter.acquire("me", "publish")
+        assert time.monotonic() - start < 0.1  # 기다리지 않고 바로 포기
+    finally:
+        server.request_deadline.reset(token)
+
+
+@pytest.mark.anyio
+async def test_async_acquire_shares_buckets_with_threads(limiter):
+    limiter.acquire("me", "create")
+    assert await limiter.acquire_async("me", "create") < 0.05
+    waited = await limiter.acquire_async("me", "create")
+    assert 0.07 <= waited < 0.5
@@ -0,0 +1,56 @@
+# tests/test_replacements.py
+# 여러 (target, replacement) 쌍을 원문 기준으로 한 번에 계산 (겹치면 409, 못 찾으면 404, 부분 적용 없음)
+
+import pytest
+from fastapi import HTTPException
+
+
+def pairs(server, *items, **options):
+    return [server.ReplacementPair(target=t, replacement=r, **options) for t, r in items]
+
+
+def test_pairs_are_applied_against_the_original_text(server):
+    text = "사과는 빨갛다. 바나나는 노랗다."
+    # 첫 교체 결과("바나나")가 두 번째 target으로 다시 잡히지 않음
+    new_text, report = server.plan_replacements(
+        text, pairs(server, ("사과", "바나나"), ("바나나", "포도")), "replace", "exact",
+    )
+    assert new_text == "바나나는 빨갛다. 포도는 노랗다."
+    assert [r["count"] for r in report] == [1, 1]
+
+
+def test_count_all_and_remove(server):
+    text = "a-b-a-b-a"
+    new_text, report = server.plan_replacements(text, pairs(server, ("a", None), count="all"), "remove", "exact")
+    assert new_text == "-b--b-"
+    assert report[0]["count"] == 3
+
+
+def test_regex_replacement_expands_groups(server):
+    text = "2024-01-05 방문"
+    new_text, _ = server.plan_replacements(
+        text, pairs(server, (r"(\d+)-(\d+)-(\d+)", r"\1년 \2월 \3일"), regex=True), "replace", "exact",
+    )
+    assert new_text == "2024년 01월 05일 방문"
+
+
+def test_overlapping_pairs_conflict(server):
+    text = "오늘은 카페를 다녀왔습니다."
+    with pytest.raises(HTTPException) as error:
+        server.plan_replacements(text, pairs(server, ("카페를 다녀", "x"), ("다녀왔습니다", "y")), "replace", "exact")
+    assert error.value.status_code == 409
+
+
+def test_missing_target_fails_the_whole_plan(server):
+    text = "오늘은 카페를 다녀왔습니다."
+    with pytest.raises(HTTPException) as error:
+        server.plan_replacements(text, pairs(server, ("카페", "식당"), ("도서관", "공원")), "replace", "exact")
+    assert error.value.status_code == 404
+    assert error.value.detail["missing"] == ["도서관"]
+
+
+@pytest.mark.parametrize("count", [0, "-1", "many"])
+def test_invalid_count_is_rejected(server, count):
+    with pytest.raises(HTTPException) as error:
+        server.plan_replacements("abc", pairs(server, ("a", "b"), count=count), "replace", "exact")
+    assert error.value.status_code == 400
@@ -0,0 +1,62 @@
+# tests/test_save_scheduler.py
+# 저장 모으기: 조용해지면 한 번, 수정이 계속 들어와도 최대 지연이 지나면 저장
+
+import time
+
+import pytest
+
+
+@pytest.fixture
+def saves(server, fake_drivers, monkeypatch):
+    """브라우저가 떠 있는 슬롯 하나 + 저장 버튼 클릭 기록"""
+    monkeypatch.setattr(server, "SAVE_QUIET_SEC", 0.15)
+    monkeypatch.setattr(server, "SAVE_MAX_DELAY_SEC", 0.4)
+    pool = fake_drivers(1)
+    slot = pool.slots[0]
+    slot.engine, slot.wait = object(), object()
+    clicks = []
+
+    def click_save(engine, wait, stage="saved"):
+        clicks.append((time.monotonic(), stage))
+        server.leased_slot().saves.mark_clean()
+
+    monkeypatch.setattr(server, "click_save", click_save)
+    return slot.saves, clicks
+
+
+def test_due_at_is_quiet_window_capped_by_max_delay(server, saves):
+    saves, _ = saves
+    assert saves._due_at() is None
+
+    saves.first_change = saves.last_change = 100.0
+    assert saves._due_at() == pytest.approx(100.0 + server.SAVE_QUIET_SEC)
+    saves.last_change = 100.3  # 계속 수정 중이어도 첫 수정 + 최대 지연을 넘기지 않음
+    assert saves._due_at() == pytest.approx(100.0 + server.SAVE_MAX_DELAY_SEC)
+    saves.retry_at = 105.0  # 실패 뒤에는 재시도 시각까지 미룸
+    assert saves._due_at() == 105.0
+
+
+def test_edits_are_coalesced_into_one_save_after_quiet(server, saves):
+    saves, clicks = saves
+    saves.start()
+    for _ in range(5):
+        saves.mark_dirty("s1")
+        time.sleep(0.02)
+    last_edit = time.monotonic()
+    time.sleep(0.5)
+
+    assert len(clicks) == 1 and clicks[0][1] == "draft_flushed"
+    assert clicks[0][0] >= last_edit + server.SAVE_QUIET_SEC - 0.02
+    assert saves.snapshot()["coalesced_saves"] == 4 and not saves.dirty
+
+
+def test_continuous_edits_are_saved_by_max_delay(server, saves):
+    saves, clicks = saves
+    saves.start()
+    first_edit = time.monotonic()
+    while time.monotonic() - first_edit < 0.7:  # 조용한 구간 없이 계속 수정
+        saves.mark_dirty("s1")
+        time.sleep(0.05)
+
+    assert clicks, "수정이 계속 들어와도 최대 지연이 지나면 저장해야 함"
+    assert clicks[0][0] - first_edit == pytest.approx(server.SAVE_MAX_DELAY_SEC, abs=0.1)
@@ -0,0 +1,110 @@
+# tests/test_session_locks.py
+# 같은 글(session_id) 작업은 도착 순서대로 하나씩, 다른 글끼리는 동시에
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def locks(server):
+    return server.SessionLocks()
+
+
+def test_same_session_runs_in_arrival_order(locks):
+    order = []
+    first_in = threading.Event()
+
+    def work(name, hold_for):
+        with locks.hold("s1"):
+            order.append(f"{name}:in")
+            first_in.set()
+            time.sleep(hold_for)
+            order.append(f"{name}:out")
+
+    threads = [threading.Thread(target=work, args=("a", 0.1))]
+    threads[0].start()
+    first_in.wait(1)
+    for name in ("b", "c"):
+        threads.append(threading.Thread(target=work, args=(name, 0.01)))
+        threads[-1].start()
+        time.sleep(0.02)  # b가 c보다 먼저 줄을 섬
+    for thread in threads:
+        thread.join(2)
+
+    assert order == ["a:in", "a:out", "b:in", "b:out", "c:in", "c:out"]
+    assert locks.snapshot()["active_sessions"] == 0
+
+
+def test_different_sessions_do_not_wait(locks):
+    with locks.hold("s1"):
+        start = time.monotonic()
+        with locks.hold("s2"):
+            pass
+        with locks.hold(None):  # session_id 없는 요청은 잠그지 않음
+            pass
+        assert time.monotonic() - start < 0.05
+
+
+def test_lock_wait_gives_up_after_timeout(server, locks, monkeypatch):
+    monkeypatch.setattr(server, "SESSION_LOCK_TIMEOUT_SEC", 0.1)
+    with locks.hold("s1"):
+        result = []
+
+        def late():
+            try:
+                with locks.hold("s1"):
+                    result.append("ran")
+            except HTTPException as e:
+                result.append(e.status_code)
+
+        thread = threading.Thread(target=late)
+        thread.start()
+        thread.join(2)
+
+    assert result == [409]
+    assert locks.snapshot()["timeouts"] == 1 and locks.snapshot()["active_sessions"] == 0
+
+
+@pytest.mark.anyio
+async def test_async_and_thread_waiters_share_one_queue(locks):
+    held = await locks.enter_async("s1")
+    entered = []
+
+    def in_thread():
+        with locks.hold("s1"):
+            entered.append("thread")
+
+    thread = threading.Thread(target=in_thread)
+    thread.start()
+    await asyncio.sleep(0.05)
+    follower = asyncio.create_task(locks.enter_async("s1"))  # 스레드 다음 차례
+    await asyncio.sleep(0.05)
+    assert entered == [] and not follower.done()
+
+    locks.leave("s1", held)
+    ticket = await asyncio.wait_for(follower, timeout=1)
+    assert entered == ["thread"]
+    locks.leave("s1", ticket)
+    thread.join(1)
+    assert locks.snapshot()["active_sessions"] == 0
+
+
+@pytest.mark.anyio
+async def test_cancelled_head_hands_over_to_next(locks):
+    """맨 앞에서 취소된 async 요청은 줄에서 빠지며 다음 차례를 깨움 (내용이 같은 남의 표는 그대로)"""
+    held = await locks.enter_async("s1")
+    second = asyncio.create_task(locks.enter_async("s1"))
+    third = asyncio.create_task(locks.enter_async("s1"))
+    await asyncio.sleep(0.02)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    locks.leave("s1", held)
+    ticket = await asyncio.wait_for(third, timeout=1)
+    locks.leave("s1", ticket)
+    assert locks.snapshot()["active_sessions"] == 0
@@ -0,0 +1,91 @@
+# tests/test_stage_timeouts.py
+# 단계별 적응형 타임아웃: 타임아웃도 샘플로, 안 뜰 수도 있는 요소는 짧게 확인
+
+import pytest
+
+from editor_engines import EngineTimeout
+
+
+@pytest.fixture
+def timeouts(server, monkeypatch):
+    stage_timeouts = server.StageTimeouts()
+    monkeypatch.setattr(server, "stage_timeouts", stage_timeouts)
+    return stage_timeouts
+
+
+def waiter(budgets, found):
+    async def wait_for(timeout):
+        budgets.append(timeout)
+        if not found:
+            raise EngineTimeout("없음")
+        return True
+    return wait_for
+
+
+def test_optional_probe_is_short_and_not_recorded(server, timeouts):
+    wait = server.AdaptiveWait(engine=None)
+    budgets = []
+    for _ in range(3):
+        assert wait.probe("popup", waiter(budgets, found=False)) is False
+
+    # 통계가 없을 때도 WAIT_TIME(15초)이 아니라 OPTIONAL_PROBE_SEC만
+    assert budgets == [server.OPTIONAL_PROBE_SEC] * 3
+    assert "popup" not in timeouts.snapshot()
+
+    assert wait.probe("popup", waiter(budgets, found=True)) is True
+    assert timeouts.snapshot()["popup"]["samples"] == 1
+
+
+def test_required_wait_timeouts_are_recorded_as_samples(server, timeouts):
+    wait = server.AdaptiveWait(engine=None)
+    with pytest.raises(EngineTimeout):
+        wait.call("save", waiter([], found=False))
+    wait.call("save", waiter([], found=True))
+
+    snapshot = timeouts.snapshot()["save"]
+    assert (snapshot["samples"], snapshot["timeouts"]) == (2, 1)
+
+
+def test_timeout_uses_upper_percentile_with_factor_and_margin(server, timeouts):
+    for _ in range(server.STAGE_TIMEOUT_MIN_SAMPLES - 1):
+        timeouts.observe("body", 1.0)
+    # 샘플이 부족하면 기본 대기시간
+    assert timeouts.timeout_for("body") == server.WAIT_TIME
+    assert timeouts.baseline("body") is None
+
+    timeouts.observe("body", 3.0)
+    p = timeouts._percentile([1.0] * (server.STAGE_TIMEOUT_MIN_SAMPLES - 1) + [3.0], server.STAGE_TIMEOUT_PERCENTILE)
+    expected = p * server.STAGE_TIMEOUT_FACTOR + server.STAGE_TIMEOUT_MARGIN
+    assert timeouts.timeout_for("body") == max(server.STAGE_TIMEOUT_MIN, min(server.STAGE_TIMEOUT_MAX, expected))
+    assert timeouts.baseline("body") == 1.0
+
+
+def test_timeout_is_clamped(server, timeouts):
+    for _ in range(server.STAGE_TIMEOUT_MIN_SAMPLES):
+        timeouts.observe("fast", 0.01)
+        timeouts.observe("stuck", 120.0)
+    assert timeouts.timeout_for("fast") == server.STAGE_TIMEOUT_MIN
+    assert timeouts.timeout_for("stuck") == server.STAGE_TIMEOUT_MAX
+
+
+def test_percentile_picks_nearest_rank(server, timeouts):
+    values = [float(v) for v in range(1, 101)]
+    assert timeouts._percentile(values, 0.5) == 51.0  # round(0.5 × 99) = 50번째(0부터)
+    assert timeouts._percentile(values, 0.99) == 99.0
+    assert timeouts._percentile(values, 1.0) == 100.0
+    assert timeouts._percentile([2.0], 0.99) == 2.0
+
+
+def test_budget_is_capped_by_request_deadline(server, timeouts):
+    token = server.request_deadline.set(server.time.monotonic() + 0.5)
+    try:
+        assert server.AdaptiveWait(engine=None).budget("body") <= 0.5
+    finally:
+        server.request_deadline.reset(token)
+
+    token = server.request_deadline.set(server.time.monotonic() - 1)
+    try:
+        with pytest.raises(server.RequestDeadlineExceeded):
+            server.AdaptiveWait(engine=None).budget("body")
+    finally:
+        server.request_deadline.reset(token)
@@ -0,0 +1,128 @@
+# trace_replay.py
+# 서버가 TRACE_DIR에 남긴 엔진 명령 기록을 가짜 에디터(fake_naver_editor.py)에서 다시 실행해 기록 당시와 비교
+# 네이버 화면이 바뀌어 느려졌는지, 우리 코드가 명령을 더 많이/느리게 보내게 됐는지를 실서버 없이 확인
+#
+# 예)  python trace_replay.py traces/*.json --engine selenium --repeat 5
+#      python trace_replay.py traces/*.json --engine cdp-async --backend cdp
+# 출력: 기록(작업)별 기록 당시 / 재생 p50 총 시간, 명령 종류별 횟수와 p50 (ms)
+# 기록 두 묶음(예: 커밋 두 개에서 같은 부하 테스트로 남긴 것)을 각각 재생해 표를 비교하면 회귀 지점을 좁힐 수 있음
+
+import argparse
+import asyncio
+import os
+import struct
+import tempfile
+import zlib
+
+from browser_backends import BACKENDS, make_input
+from editor_engines import ENGINES, CdpBrowser, SeleniumEngine
+from engine_trace import fake_editor_url, load_trace, replay_trace
+from fake_naver_editor import serve_fake_editor
+
+
+def tiny_png() -> bytes:
+    """set_files 재생용 1×1 PNG"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(b"\x00\xff\xff\xff"))
+        + chunk(b"IEND", b"")
+    )
+
+
+def prepare_files(traces: list[dict], directory: str):
+    names = {name for t in traces for c in t["commands"] if c["cmd"] == "set_files" for name in c["args"]["files"]}
+    for name in names:
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(tiny_png())
+
+
+async def open_engine(args):
+    """(engine, 닫기 코루틴 함수)"""
+    if args.engine == "selenium":
+        from backend_benchmark import start_browser
+
+        driver = await asyncio.to_thread(start_browser, not args.headed)
+        engine = SeleniumEngine(driver, make_input(driver, args.backend))
+        return engine, engine.close
+    browser = await CdpBrowser.launch(headless=not args.headed)
+    return await browser.new_tab(), browser.close
+
+
+def pct(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+async def run(args):
+    traces = [(path, load_trace(path)) for path in sorted(args.traces)]
+    map_url = fake_editor_url(args.port)
+    files_dir = tempfile.mkdtemp(prefix="trace-files-")
+    prepare_files([t for _, t in traces], files_dir)
+
+    engine, close = await open_engine(args)
+    totals: dict[str, list[float]] = {path: [] for path, _ in traces}
+    replayed: dict[str, list[float]] = {}
+    failures: dict[str, str] = {}
+    try:
+        for _ in range(args.repeat):
+            for path, trace in traces:
+                try:
+                    results = await replay_trace(trace, engine, map_url, files_dir)
+                except Exception as e:
+                    failures[path] = f"{type(e).__name__}: {e}"
+                    continue
+                totals[path].append(sum(r["dur_ms"] for r in results))
+                for r in results:
+                    replayed.setdefault(r["cmd"], []).append(r["dur_ms"])
+    finally:
+        await close()
+
+    print(f"\n{'trace':<48}{'cmds':>6}{'recorded':>11}{'replay p50':>12}{'ratio':>8}  (ms)")
+    for path, trace in traces:
+        recorded = sum(c["dur_ms"] for c in trace["commands"])
+        if path in failures:
+            print(f"{os.path.basename(path)[:47]:<48}{len(trace['commands']):>6}{recorded:>11.1f}  ⚠️ {failures[path]}")
+            continue
+        replay = pct(totals[path], .5)
+        print(
+            f"{os.path.basename(path)[:47]:<48}{len(trace['commands']):>6}{recorded:>11.1f}"
+            f"{replay:>12.1f}{replay / recorded if recorded else 0:>8.2f}"
+        )
+
+    recorded_by_cmd: dict[str, list[float]] = {}
+    for _, trace in traces:
+        for c in trace["commands"]:
+            recorded_by_cmd.setdefault(c["cmd"], []).append(c["dur_ms"])
+    print(f"\n{'command':<18}{'count':>7}{'recorded p50':>14}{'replay p50':>12}{'replay p90':>12}  (ms)")
+    for cmd in sorted(recorded_by_cmd):
+        values = replayed.get(cmd, [])
+        print(
+            f"{cmd:<18}{len(recorded_by_cmd[cmd]):>7}{pct(recorded_by_cmd[cmd], .5):>14.1f}"
+            f"{pct(values, .5):>12.1f}{pct(values, .9):>12.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔진 명령 기록을 가짜 에디터에서 재생해 비교")
+    parser.add_argument("traces", nargs="+", help="TRACE_DIR의 기록 파일 (시작 시각 순으로 재생)")
+    parser.add_argument("--engine", default="selenium", choices=ENGINES)
+    parser.add_argument("--backend", default="selenium", choices=list(BACKENDS), help="selenium 엔진의 입력 경로")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765, help="가짜 에디터 포트")
+    parser.add_argument("--latency-ms", type=float, default=0, help="가짜 에디터 응답 지연")
+    parser.add_argument("--headed", action="store_true", help="창을 띄워서 실행")
+    args = parser.parse_args()
+
+    server, _ = serve_fake_editor(args.port, args.latency_ms, background=True)
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()